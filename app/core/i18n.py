@@ -24,7 +24,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
 _TRANSLATIONS_DIR = Path(__file__).parent.parent.parent / "translations"
 
@@ -34,6 +34,9 @@ class TranslationManager:
 
     _instance: TranslationManager | None = None
     _listeners: list[Callable[[], None]] = []
+    # Bumped whenever a string table is loaded; callers that cache
+    # translated strings include it in their cache key
+    lang_gen: int = 0
 
     def __init__(self, lang: str = "tr"):
         self.lang = lang
@@ -48,6 +51,7 @@ class TranslationManager:
             self._strings = _flatten(data)
         else:
             self._strings = {}
+        TranslationManager.lang_gen += 1
 
     def get(self, key: str, default: str = "") -> str:
         """Get translated string by dot-key. Falls back to default (English)."""
@@ -117,3 +121,16 @@ def t(key: str, default: str = "") -> str:
         Translated string or default.
     """
     return TranslationManager.instance().get(key, default)
+
+
+def t_many(pairs: Iterable[tuple[str, str]]) -> list[str]:
+    """Translate several ``(key, default)`` pairs with one manager lookup.
+
+    Useful for header/label lists built together, e.g. table columns.
+
+    Returns:
+        Translated strings (or defaults), in input order.
+    """
+    # Same lookup as t(), with the singleton resolved once
+    get = TranslationManager.instance().get
+    return [get(key, default) for key, default in pairs]
@@ -196,16 +196,38 @@ class DesignRepository:
     # Version History
     # ------------------------------------------------------------------
 
-    def get_version_history(self, design_id: str) -> list[DesignVersion]:
-        """List all versions for a design, newest first."""
+    def get_version_history(
+        self,
+        design_id: str,
+        limit: int | None = None,
+        before_version: int | None = None,
+    ) -> list[DesignVersion]:
+        """List versions for a design, newest first.
+
+        Pagination is keyset-based: pass the version number of the last
+        row of the previous page as *before_version* to get the next page.
+
+        Args:
+            design_id: Design ID.
+            limit: Maximum number of versions to return (None = all).
+            before_version: Return only versions older than this one.
+        """
         conn = self._db.connect()
-        rows = conn.execute(
-            """SELECT id, design_id, version_number, change_note, created_at
-               FROM design_versions
-               WHERE design_id = ?
-               ORDER BY version_number DESC""",
-            (design_id,),
-        ).fetchall()
+        sql = """SELECT id, design_id, version_number, change_note, created_at
+                 FROM design_versions
+                 WHERE design_id = ?"""
+        params: list = [design_id]
+
+        if before_version is not None:
+            sql += " AND version_number < ?"
+            params.append(before_version)
+
+        sql += " ORDER BY version_number DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = conn.execute(sql, params).fetchall()
         return [
             DesignVersion(
                 id=r[0], design_id=r[1], version_number=r[2],
@@ -325,7 +347,7 @@ class DesignRepository:
         parent_type: str,
         parent_id: str,
         content: str,
-    ) -> str:
+    ) -> dict:
         """Add a note to a design or simulation.
 
         Args:
@@ -334,7 +356,7 @@ class DesignRepository:
             content: Note text.
 
         Returns:
-            Note ID.
+            Dict with id, content, created_at (same shape as get_notes).
         """
         conn = self._db.connect()
         note_id = str(uuid.uuid4())
@@ -344,30 +366,49 @@ class DesignRepository:
             (note_id, parent_type, parent_id, content),
         )
         conn.commit()
-        return note_id
+        row = conn.execute(
+            "SELECT created_at FROM notes WHERE id = ?", (note_id,)
+        ).fetchone()
+        return {"id": note_id, "content": content, "created_at": row[0] or ""}
 
     def get_notes(
         self,
         parent_type: str,
         parent_id: str,
+        limit: int | None = None,
+        before_id: str | None = None,
     ) -> list[dict]:
-        """Get all notes for a parent entity.
+        """Get notes for a parent entity, newest first.
+
+        Pagination is keyset-based: pass the ID of the last note of the
+        previous page as *before_id* to get the next (older) page.
 
         Args:
             parent_type: 'design' or 'simulation'.
             parent_id: ID of the parent entity.
+            limit: Maximum number of notes to return (None = all).
+            before_id: Return only notes older than this note.
 
         Returns:
             List of dicts with id, content, created_at.
         """
         conn = self._db.connect()
-        rows = conn.execute(
-            """SELECT id, content, created_at
-               FROM notes
-               WHERE parent_type = ? AND parent_id = ?
-               ORDER BY created_at DESC""",
-            (parent_type, parent_id),
-        ).fetchall()
+        sql = """SELECT id, content, created_at
+                 FROM notes
+                 WHERE parent_type = ? AND parent_id = ?"""
+        params: list = [parent_type, parent_id]
+
+        if before_id is not None:
+            sql += """ AND (created_at, rowid) <
+                       (SELECT created_at, rowid FROM notes WHERE id = ?)"""
+            params.append(before_id)
+
+        sql += " ORDER BY created_at DESC, rowid DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = conn.execute(sql, params).fetchall()
         return [
             {"id": r[0], "content": r[1], "created_at": r[2] or ""}
             for r in rows
@@ -79,6 +79,10 @@ from app.models.simulation import ComptonConfig
 from app.ui.charts.isodose_chart import IsodoseChartWidget
 
 
+# Upper bound [ms] on close for a cancelled validation run / report build
+_POOL_TASK_WAIT_MS = 1000
+
+
 class MainWindow(QMainWindow):
     """Application main window with canvas, side panels, and toolbar."""
 
@@ -133,6 +137,8 @@ class MainWindow(QMainWindow):
         self._current_design_id: str | None = None
         self._is_dirty: bool = False
         self._last_simulation_result: SimulationResult | None = None
+        # ValidationDialog, built on first use and reused (hidden) afterwards
+        self._validation_dialog = None
 
         self._build_ui()
         self._connect_signals()
@@ -205,6 +211,9 @@ class MainWindow(QMainWindow):
             self._right_scroll,
         )
         self._right_dock.setMinimumWidth(320)
+        # The layer panel stops following the controller while its dock
+        # is closed or tabbed away
+        self._right_dock.visibilityChanged.connect(self._layer_panel.set_active)
 
         # Bottom panel — Chart tabs
         self._chart_tabs = self._create_chart_tabs()
@@ -277,6 +286,13 @@ class MainWindow(QMainWindow):
             self._beam_figure.tight_layout()
             self._beam_canvas.draw()
 
+        # Cached validation dialog was built with the old language; a
+        # cancelled run may still be going and must not report to it
+        if self._validation_dialog is not None:
+            self._validation_dialog.shutdown(_POOL_TASK_WAIT_MS)
+            self._validation_dialog.deleteLater()
+            self._validation_dialog = None
+
         self.statusBar().showMessage(t("status.ready", "Ready"))
 
     def _show_panel_for_object(self, object_type: str) -> None:
@@ -629,6 +645,12 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         self._save_state()
+        # Let a cancelled validation run / report build wind down before
+        # its QObjects are torn down with the interpreter; returns at once
+        # when none is running
+        if self._validation_dialog is not None:
+            self._validation_dialog.reject()
+            self._validation_dialog.shutdown(_POOL_TASK_WAIT_MS)
         self._db_manager.close()
         super().closeEvent(event)
 
@@ -1526,9 +1548,12 @@ class MainWindow(QMainWindow):
 
     def _on_run_validation(self) -> None:
         """Open validation dialog and run physics engine tests."""
-        from app.ui.dialogs.validation_dialog import ValidationDialog
-        dlg = ValidationDialog(self)
-        dlg.exec()
+        if self._validation_dialog is None:
+            from app.ui.dialogs.validation_dialog import ValidationDialog
+            self._validation_dialog = ValidationDialog(self)
+        else:
+            self._validation_dialog.reset_and_run()
+        self._validation_dialog.exec()
 
     def _on_about(self) -> None:
         """Show about dialog."""
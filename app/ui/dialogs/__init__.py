@@ -1,19 +1,45 @@
-"""Dialogs — modal dialog windows (save, open, export, version history, etc.)."""
-
-from app.ui.dialogs.save_design_dialog import SaveDesignDialog
-from app.ui.dialogs.design_manager import DesignManagerDialog
-from app.ui.dialogs.export_dialog import ExportDialog
-from app.ui.dialogs.version_history_dialog import VersionHistoryDialog
-from app.ui.dialogs.about_dialog import AboutDialog
-from app.ui.dialogs.simulation_config_dialog import SimulationConfigDialog
-from app.ui.dialogs.notes_dialog import NotesDialog
-
-__all__ = [
-    "SaveDesignDialog",
-    "DesignManagerDialog",
-    "ExportDialog",
-    "VersionHistoryDialog",
-    "AboutDialog",
-    "SimulationConfigDialog",
-    "NotesDialog",
-]
+"""Dialogs — modal dialog windows (save, open, export, version history, etc.).
+
+Dialog classes are resolved lazily (PEP 562): ``from app.ui.dialogs import
+ExportDialog`` imports only ``export_dialog`` on first access, and importing
+one dialog submodule no longer pulls in all the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.ui.dialogs.save_design_dialog import SaveDesignDialog
+    from app.ui.dialogs.design_manager import DesignManagerDialog
+    from app.ui.dialogs.export_dialog import ExportDialog
+    from app.ui.dialogs.version_history_dialog import VersionHistoryDialog
+    from app.ui.dialogs.about_dialog import AboutDialog
+    from app.ui.dialogs.simulation_config_dialog import SimulationConfigDialog
+    from app.ui.dialogs.notes_dialog import NotesDialog
+
+_LAZY_EXPORTS = {
+    "SaveDesignDialog": "app.ui.dialogs.save_design_dialog",
+    "DesignManagerDialog": "app.ui.dialogs.design_manager",
+    "ExportDialog": "app.ui.dialogs.export_dialog",
+    "VersionHistoryDialog": "app.ui.dialogs.version_history_dialog",
+    "AboutDialog": "app.ui.dialogs.about_dialog",
+    "SimulationConfigDialog": "app.ui.dialogs.simulation_config_dialog",
+    "NotesDialog": "app.ui.dialogs.notes_dialog",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,6 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QCheckBox, QPushButton, QSpinBox, QGroupBox,
 )
-from PyQt6.QtCore import Qt
 
 from app.core.i18n import t
 from app.core.spectrum_models import effective_energy_kVp
@@ -3,18 +3,63 @@
 Reference: Phase-06 spec — FR-4.1.5.
 """
 
+import os
+
 from PyQt6.QtWidgets import (
     QCheckBox, QDialog, QDialogButtonBox, QFileDialog,
     QGroupBox, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QRadioButton, QVBoxLayout,
 )
+from PyQt6.QtCore import QSettings
 
 from app.core.i18n import t
 
 
+# Format key -> (radio label, save dialog title, file filter), each an
+# i18n (key, default) pair.
+_FORMATS: dict[str, tuple[tuple[str, str], ...]] = {
+    "pdf": (
+        ("dialogs.export_pdf", "PDF Report"),
+        ("dialogs.export_save_pdf", "Save PDF"),
+        ("dialogs.export_filter_pdf", "PDF Files (*.pdf)"),
+    ),
+    "csv": (
+        ("dialogs.export_csv", "CSV (Beam Profile)"),
+        ("dialogs.export_save_csv", "Save CSV"),
+        ("dialogs.export_filter_csv", "CSV Files (*.csv)"),
+    ),
+    "json": (
+        ("dialogs.export_json", "JSON (Geometry)"),
+        ("dialogs.export_save_json", "Save JSON"),
+        ("dialogs.export_filter_json", "JSON Files (*.json)"),
+    ),
+    "png": (
+        ("dialogs.export_png", "PNG (Canvas Image)"),
+        ("dialogs.export_save_png", "Save PNG"),
+        ("dialogs.export_filter_png", "PNG Files (*.png)"),
+    ),
+    "svg": (
+        ("dialogs.export_svg", "SVG (Vector Image)"),
+        ("dialogs.export_save_svg", "Save SVG"),
+        ("dialogs.export_filter_svg", "SVG Files (*.svg)"),
+    ),
+    "cdt": (
+        ("dialogs.export_cdt", "CDT Project File"),
+        ("dialogs.export_save_cdt", "Save CDT"),
+        ("dialogs.export_filter_cdt", "CDT Files (*.cdt)"),
+    ),
+}
+
+
 class ExportDialog(QDialog):
     """Universal export dialog with format selection and options."""
 
+    # Skip per-entry icon lookups and symlink resolution (slow on network drives)
+    _FD_OPTS = (
+        QFileDialog.Option.DontUseCustomDirectoryIcons
+        | QFileDialog.Option.DontResolveSymlinks
+    )
+
     def __init__(
         self,
         has_simulation: bool = False,
@@ -32,26 +77,14 @@ class ExportDialog(QDialog):
         fmt_group = QGroupBox(t("dialogs.export_format", "Format"))
         fmt_layout = QVBoxLayout(fmt_group)
 
-        self._radio_pdf = QRadioButton(t("dialogs.export_pdf", "PDF Report"))
-        self._radio_pdf.setChecked(True)
-        self._radio_pdf.toggled.connect(self._on_format_changed)
-        fmt_layout.addWidget(self._radio_pdf)
-
-        self._radio_csv = QRadioButton(t("dialogs.export_csv", "CSV (Beam Profile)"))
-        self._radio_csv.setEnabled(has_simulation)
-        fmt_layout.addWidget(self._radio_csv)
-
-        self._radio_json = QRadioButton(t("dialogs.export_json", "JSON (Geometry)"))
-        fmt_layout.addWidget(self._radio_json)
-
-        self._radio_png = QRadioButton(t("dialogs.export_png", "PNG (Canvas Image)"))
-        fmt_layout.addWidget(self._radio_png)
-
-        self._radio_svg = QRadioButton(t("dialogs.export_svg", "SVG (Vector Image)"))
-        fmt_layout.addWidget(self._radio_svg)
-
-        self._radio_cdt = QRadioButton(t("dialogs.export_cdt", "CDT Project File"))
-        fmt_layout.addWidget(self._radio_cdt)
+        self._radios: dict[str, QRadioButton] = {}
+        for key, (label, _title, _filter) in _FORMATS.items():
+            radio = QRadioButton(t(*label))
+            fmt_layout.addWidget(radio)
+            self._radios[key] = radio
+        self._radios["csv"].setEnabled(has_simulation)
+        self._radios["pdf"].setChecked(True)
+        self._current_key = "pdf"
 
         layout.addWidget(fmt_group)
 
@@ -108,60 +141,29 @@ class ExportDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        for radio in self._radios.values():
+            radio.toggled.connect(self._on_format_changed)
         self._on_format_changed()
 
     def _on_format_changed(self) -> None:
-        """Show/hide PDF options based on format selection."""
-        self._pdf_group.setVisible(self._radio_pdf.isChecked())
+        """Track the selected format and show/hide PDF options."""
+        for key, radio in self._radios.items():
+            if radio.isChecked():
+                self._current_key = key
+                break
+        self._pdf_group.setVisible(self._current_key == "pdf")
 
     def _browse(self) -> None:
         """Open file dialog for output path."""
-        if self._radio_pdf.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_pdf", "Save PDF"),
-                "",
-                t("dialogs.export_filter_pdf", "PDF Files (*.pdf)"),
-            )
-        elif self._radio_csv.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_csv", "Save CSV"),
-                "",
-                t("dialogs.export_filter_csv", "CSV Files (*.csv)"),
-            )
-        elif self._radio_json.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_json", "Save JSON"),
-                "",
-                t("dialogs.export_filter_json", "JSON Files (*.json)"),
-            )
-        elif self._radio_png.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_png", "Save PNG"),
-                "",
-                t("dialogs.export_filter_png", "PNG Files (*.png)"),
-            )
-        elif self._radio_svg.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_svg", "Save SVG"),
-                "",
-                t("dialogs.export_filter_svg", "SVG Files (*.svg)"),
-            )
-        elif self._radio_cdt.isChecked():
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                t("dialogs.export_save_cdt", "Save CDT"),
-                "",
-                t("dialogs.export_filter_cdt", "CDT Files (*.cdt)"),
-            )
-        else:
-            return
-
+        _label, title, file_filter = _FORMATS[self._current_key]
+        settings = QSettings()
+        dir_key = f"export/last_dir/{self._current_key}"
+        start_dir = settings.value(dir_key, "", type=str)
+        path, _ = QFileDialog.getSaveFileName(
+            self, t(*title), start_dir, t(*file_filter), options=self._FD_OPTS,
+        )
         if path:
+            settings.setValue(dir_key, os.path.dirname(path))
             self._path_edit.setText(path)
 
     def _on_accept(self) -> None:
@@ -169,20 +171,8 @@ class ExportDialog(QDialog):
             self.accept()
 
     def get_format(self) -> str:
-        """Return selected format: 'pdf', 'csv', 'json', 'png', 'cdt'."""
-        if self._radio_pdf.isChecked():
-            return "pdf"
-        if self._radio_csv.isChecked():
-            return "csv"
-        if self._radio_json.isChecked():
-            return "json"
-        if self._radio_png.isChecked():
-            return "png"
-        if self._radio_svg.isChecked():
-            return "svg"
-        if self._radio_cdt.isChecked():
-            return "cdt"
-        return "pdf"
+        """Return selected format: 'pdf', 'csv', 'json', 'png', 'svg', 'cdt'."""
+        return self._current_key
 
     def get_output_path(self) -> str:
         """Return selected output file path."""
@@ -2,20 +2,181 @@
 
 Backend: DesignRepository.add_note / get_notes / delete_note (already implemented).
 
+Notes live in ``_NotesModel`` and are shown in a QListView, so only the
+visible rows are painted. The model pages notes from the repository
+(``_NOTES_PAGE_SIZE`` at a time, see ``KeysetPagedModel``) as the view
+scrolls to the bottom.
+Rows are drawn by ``_NoteDelegate`` (rich text + delete glyph) rather
+than one QLabel/QPushButton widget pair per note.
+
 Reference: Phase-06 spec.
 """
 
 from __future__ import annotations
 
+import html
+from typing import TYPE_CHECKING, Callable
+
 from PyQt6.QtWidgets import (
     QDialog, QDialogButtonBox, QHBoxLayout, QLabel,
-    QListWidget, QListWidgetItem, QPushButton,
-    QTextEdit, QVBoxLayout, QWidget,
+    QListView, QPushButton,
+    QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+    QTextEdit, QToolTip, QVBoxLayout,
+)
+from PyQt6.QtCore import QEvent, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import (
+    QAbstractTextDocumentLayout, QColor, QCursor, QFont, QPalette, QTextDocument,
 )
-from PyQt6.QtCore import Qt
 
 from app.core.i18n import t
-from app.database.design_repository import DesignRepository
+from app.ui.styles.colors import ERROR, TEXT_PRIMARY
+from app.ui.widgets.paged_model import KeysetPagedModel
+
+if TYPE_CHECKING:
+    from app.database.design_repository import DesignRepository
+
+
+_NOTE_ID_ROLE = Qt.ItemDataRole.UserRole
+_NOTES_PAGE_SIZE = 50
+
+
+class _NotesModel(KeysetPagedModel):
+    """List model over note dicts (id, content, created_at), newest first.
+
+    Paged by note id (``_NOTES_PAGE_SIZE`` notes per page).
+    """
+
+    def __init__(self, fetch_page: Callable[[str | None], list[dict]], parent=None):
+        super().__init__(fetch_page, _NOTES_PAGE_SIZE, parent)
+
+    def _page_key(self, note: dict) -> str:
+        return note["id"]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        note = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"<b>{note['created_at'][:16]}</b>  {html.escape(note['content'])}"
+        if role == _NOTE_ID_ROLE:
+            return note["id"]
+        return None
+
+    def prepend_note(self, note: dict) -> None:
+        """Insert *note* as the first row."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, note)
+        self.endInsertRows()
+
+    def remove_note(self, note_id: str) -> None:
+        """Remove the row for *note_id*, if present."""
+        for row, note in enumerate(self._rows):
+            if note["id"] == note_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+                return
+
+
+class _NoteDelegate(QStyledItemDelegate):
+    """Paints a note row as rich text with a delete glyph on the right."""
+
+    delete_requested = pyqtSignal(str)
+
+    _DEL_GLYPH = "\u2715"
+    _DEL_WIDTH = 24
+    _MARGIN_X = 4
+    _MARGIN_Y = 2
+    _TEXT_COLOR = QColor(TEXT_PRIMARY)
+    _DEL_COLOR = QColor(ERROR)
+    _DEL_HOVER_COLOR = QColor("#F87171")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Row styling is built once and shared by every paint/sizeHint call
+        self._doc = QTextDocument(self)
+        self._doc.setDefaultFont(QFont(self._doc.defaultFont().family(), 9))
+        self._paint_ctx = QAbstractTextDocumentLayout.PaintContext()
+        self._paint_ctx.palette.setColor(QPalette.ColorRole.Text, self._TEXT_COLOR)
+        self._del_font: QFont | None = None
+
+    def _document(self, text: str, width: int) -> QTextDocument:
+        doc = self._doc
+        doc.setHtml(text)
+        doc.setTextWidth(max(width, 1))
+        return doc
+
+    def _text_width(self, total_width: int) -> int:
+        return total_width - self._DEL_WIDTH - 3 * self._MARGIN_X
+
+    def _delete_rect(self, rect: QRect) -> QRect:
+        return QRect(
+            rect.right() - self._MARGIN_X - self._DEL_WIDTH + 1,
+            rect.top() + (rect.height() - self._DEL_WIDTH) // 2,
+            self._DEL_WIDTH, self._DEL_WIDTH,
+        )
+
+    def paint(self, painter, option, index) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style is not None:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        rect = option.rect
+        doc = self._document(text, self._text_width(rect.width()))
+        painter.save()
+        painter.translate(rect.left() + self._MARGIN_X, rect.top() + self._MARGIN_Y)
+        doc.documentLayout().draw(painter, self._paint_ctx)
+        painter.restore()
+
+        del_rect = self._delete_rect(rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver) and (
+            opt.widget is not None
+            and del_rect.contains(
+                opt.widget.viewport().mapFromGlobal(QCursor.pos()))
+        )
+        if self._del_font is None:
+            self._del_font = QFont(painter.font())
+            self._del_font.setBold(True)
+        painter.save()
+        painter.setFont(self._del_font)
+        painter.setPen(self._DEL_HOVER_COLOR if hovered else self._DEL_COLOR)
+        painter.drawText(del_rect, Qt.AlignmentFlag.AlignCenter, self._DEL_GLYPH)
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        width = option.rect.width()
+        if width <= 0 and option.widget is not None:
+            width = option.widget.viewport().width()
+        doc = self._document(index.data(), self._text_width(width))
+        height = int(doc.size().height()) + 2 * self._MARGIN_Y
+        return QSize(width, max(height, self._DEL_WIDTH + 2 * self._MARGIN_Y))
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and self._delete_rect(option.rect).contains(event.position().toPoint())
+        ):
+            self.delete_requested.emit(index.data(_NOTE_ID_ROLE))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        if (
+            event.type() == QEvent.Type.ToolTip
+            and self._delete_rect(option.rect).contains(event.pos())
+        ):
+            QToolTip.showText(
+                event.globalPos(),
+                t("dialogs.notes_delete_tooltip", "Delete note"),
+                view,
+            )
+            return True
+        return super().helpEvent(event, view, option, index)
 
 
 class NotesDialog(QDialog):
@@ -56,7 +217,15 @@ class NotesDialog(QDialog):
 
         # Notes list
         layout.addWidget(QLabel(t("dialogs.notes_existing", "Existing Notes:")))
-        self._list = QListWidget()
+        self._model = _NotesModel(self._fetch_notes_page, self)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setMouseTracking(True)
+        self._list.setWordWrap(True)
+        self._list.setResizeMode(QListView.ResizeMode.Adjust)
+        self._delegate = _NoteDelegate(self._list)
+        self._delegate.delete_requested.connect(self._delete_note)
+        self._list.setItemDelegate(self._delegate)
         layout.addWidget(self._list)
 
         # Close button
@@ -65,50 +234,27 @@ class NotesDialog(QDialog):
         layout.addWidget(buttons)
 
     def _load_notes(self) -> None:
-        """Reload notes from database."""
-        self._list.clear()
-        notes = self._repo.get_notes(self._parent_type, self._parent_id)
-        for note in notes:
-            item = QListWidgetItem()
-            widget = self._create_note_widget(note)
-            item.setSizeHint(widget.sizeHint())
-            self._list.addItem(item)
-            self._list.setItemWidget(item, widget)
-
-    def _create_note_widget(self, note: dict) -> QWidget:
-        """Create a widget for a single note with delete button."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-
-        text = QLabel(f"<b>{note['created_at'][:16]}</b>  {note['content']}")
-        text.setWordWrap(True)
-        text.setStyleSheet("color: #F8FAFC; font-size: 9pt;")
-        layout.addWidget(text, 1)
-
-        btn_del = QPushButton("\u2715")
-        btn_del.setFixedSize(24, 24)
-        btn_del.setToolTip(t("dialogs.notes_delete_tooltip", "Delete note"))
-        btn_del.setStyleSheet(
-            "QPushButton { color: #EF4444; border: none; font-weight: bold; }"
-            "QPushButton:hover { color: #F87171; }"
-        )
-        note_id = note["id"]
-        btn_del.clicked.connect(lambda _, nid=note_id: self._delete_note(nid))
-        layout.addWidget(btn_del)
+        """Reload notes from database (first page)."""
+        self._model.reload()
 
-        return widget
+    def _fetch_notes_page(self, before_id: str | None) -> list[dict]:
+        """Fetch one page of notes older than *before_id*."""
+        return self._repo.get_notes(
+            self._parent_type, self._parent_id,
+            limit=_NOTES_PAGE_SIZE, before_id=before_id,
+        )
 
     def _add_note(self) -> None:
         """Add a new note from the text input."""
         content = self._text_edit.toPlainText().strip()
         if not content:
             return
-        self._repo.add_note(self._parent_type, self._parent_id, content)
+        note = self._repo.add_note(self._parent_type, self._parent_id, content)
         self._text_edit.clear()
-        self._load_notes()
+        # Newest first, matching get_notes ordering
+        self._model.prepend_note(note)
 
     def _delete_note(self, note_id: str) -> None:
-        """Delete a note by ID and refresh."""
+        """Delete a note by ID and remove its row."""
         self._repo.delete_note(note_id)
-        self._load_notes()
+        self._model.remove_note(note_id)
@@ -41,14 +41,30 @@ class SaveDesignDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addRow(buttons)
 
+        self._cached_values: tuple[str, str, list[str]] | None = None
+
+    def accept(self) -> None:
+        """Snapshot the entered values, then close."""
+        self._cached_values = self._read_values()
+        super().accept()
+
     def set_name(self, name: str) -> None:
         """Pre-fill the name field."""
         self._name_edit.setText(name)
 
     def get_values(self) -> tuple[str, str, list[str]]:
         """Return (name, description, tags)."""
+        if self._cached_values is not None:
+            name, desc, tags = self._cached_values
+            return name, desc, list(tags)
+        return self._read_values()
+
+    def _read_values(self) -> tuple[str, str, list[str]]:
         name = self._name_edit.text().strip() or t("dialogs.save_default_name", "New Design")
         desc = self._desc_edit.toPlainText().strip()
         tags_text = self._tags_edit.text().strip()
-        tags = [tag.strip() for tag in tags_text.split(",") if tag.strip()] if tags_text else []
+        if not tags_text:
+            tags = []
+        else:
+            tags = list(filter(None, (tag.strip() for tag in tags_text.split(","))))
         return name, desc, tags
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from PyQt6.QtWidgets import (
     QCheckBox, QDialog, QDialogButtonBox, QDoubleSpinBox,
-    QFormLayout, QGroupBox, QSpinBox, QVBoxLayout,
+    QFormLayout, QGroupBox, QSpinBox, QVBoxLayout, QWidget,
 )
 
 from app.constants import DEFAULT_NUM_RAYS, MAX_NUM_RAYS, MIN_NUM_RAYS
@@ -17,6 +17,14 @@ from app.core.i18n import t
 from app.models.simulation import ComptonConfig, SimulationConfig
 
 
+def _kev_spin() -> QDoubleSpinBox:
+    """Energy spin box: 0.1 keV resolution with unit suffix."""
+    spin = QDoubleSpinBox()
+    spin.setDecimals(1)
+    spin.setSuffix(" keV")
+    return spin
+
+
 class SimulationConfigDialog(QDialog):
     """Dialog for configuring simulation parameters."""
 
@@ -29,9 +37,23 @@ class SimulationConfigDialog(QDialog):
         self.setWindowTitle(t("dialogs.sim_config_title", "Simulation Settings"))
         self.setMinimumWidth(380)
         self._current = current
-        self._build_ui()
+        self._built = False
+
+    def setVisible(self, visible: bool) -> None:
+        """Build widgets on first show rather than at construction.
+
+        Done before QDialog sizes and centres itself on the parent, which
+        happens before showEvent.
+        """
+        if visible and not self._built:
+            self._build_ui()
+        super().setVisible(visible)
 
     def _build_ui(self) -> None:
+        if self._built:
+            return
+        self._built = True
+
         layout = QVBoxLayout(self)
 
         cur = self._current
@@ -40,11 +62,11 @@ class SimulationConfigDialog(QDialog):
         gen_group = QGroupBox(t("dialogs.sim_config_general", "General"))
         gen_form = QFormLayout(gen_group)
 
-        self._spin_rays = QSpinBox()
-        self._spin_rays.setRange(MIN_NUM_RAYS, MAX_NUM_RAYS)
-        self._spin_rays.setSingleStep(1000)
-        self._spin_rays.setValue(cur.num_rays if cur else DEFAULT_NUM_RAYS)
-        gen_form.addRow(t("dialogs.sim_config_rays", "Ray Count:"), self._spin_rays)
+        self._add_spin_rows(gen_form, [
+            ("_spin_rays", QSpinBox, (MIN_NUM_RAYS, MAX_NUM_RAYS), 1000,
+             cur.num_rays if cur else DEFAULT_NUM_RAYS,
+             "sim_config_rays", "Ray Count:"),
+        ])
 
         self._cb_buildup = QCheckBox(t("dialogs.sim_config_include", "Include"))
         self._cb_buildup.setChecked(cur.include_buildup if cur else True)
@@ -71,23 +93,18 @@ class SimulationConfigDialog(QDialog):
         self._cb_scatter.toggled.connect(self._on_scatter_toggled)
         scatter_form.addRow(self._cb_scatter)
 
-        self._spin_scatter_order = QSpinBox()
-        self._spin_scatter_order.setRange(1, 5)
-        self._spin_scatter_order.setValue(cc.max_scatter_order)
-        scatter_form.addRow(t("dialogs.sim_config_max_scatter", "Max Scatter Order:"), self._spin_scatter_order)
-
-        self._spin_scatter_rays = QSpinBox()
-        self._spin_scatter_rays.setRange(1, 100)
-        self._spin_scatter_rays.setValue(cc.scatter_rays_per_interaction)
-        scatter_form.addRow(t("dialogs.sim_config_rays_per_interaction", "Rays/Interaction:"), self._spin_scatter_rays)
-
-        self._spin_min_energy = QDoubleSpinBox()
-        self._spin_min_energy.setRange(1.0, 1000.0)
-        self._spin_min_energy.setSingleStep(5.0)
-        self._spin_min_energy.setDecimals(1)
-        self._spin_min_energy.setSuffix(" keV")
-        self._spin_min_energy.setValue(cc.min_energy_cutoff_keV)
-        scatter_form.addRow(t("dialogs.sim_config_min_energy", "Min Energy Cutoff:"), self._spin_min_energy)
+        self._scatter_form = scatter_form
+        self._scatter_rows = self._add_spin_rows(scatter_form, [
+            ("_spin_scatter_order", QSpinBox, (1, 5), 1,
+             cc.max_scatter_order,
+             "sim_config_max_scatter", "Max Scatter Order:"),
+            ("_spin_scatter_rays", QSpinBox, (1, 100), 1,
+             cc.scatter_rays_per_interaction,
+             "sim_config_rays_per_interaction", "Rays/Interaction:"),
+            ("_spin_min_energy", _kev_spin, (1.0, 1000.0), 5.0,
+             cc.min_energy_cutoff_keV,
+             "sim_config_min_energy", "Min Energy Cutoff:"),
+        ])
 
         layout.addWidget(scatter_group)
 
@@ -102,23 +119,15 @@ class SimulationConfigDialog(QDialog):
         self._cb_isodose.toggled.connect(self._on_isodose_toggled)
         isodose_form.addRow(self._cb_isodose)
 
-        self._spin_isodose_nx = QSpinBox()
-        self._spin_isodose_nx.setRange(20, 300)
-        self._spin_isodose_nx.setSingleStep(10)
-        self._spin_isodose_nx.setValue(cur.isodose_nx if cur else 120)
-        isodose_form.addRow(
-            t("dialogs.sim_config_isodose_nx", "X Resolution:"),
-            self._spin_isodose_nx,
-        )
-
-        self._spin_isodose_ny = QSpinBox()
-        self._spin_isodose_ny.setRange(20, 200)
-        self._spin_isodose_ny.setSingleStep(10)
-        self._spin_isodose_ny.setValue(cur.isodose_ny if cur else 80)
-        isodose_form.addRow(
-            t("dialogs.sim_config_isodose_ny", "Y Resolution:"),
-            self._spin_isodose_ny,
-        )
+        self._isodose_form = isodose_form
+        self._isodose_rows = self._add_spin_rows(isodose_form, [
+            ("_spin_isodose_nx", QSpinBox, (20, 300), 10,
+             cur.isodose_nx if cur else 120,
+             "sim_config_isodose_nx", "X Resolution:"),
+            ("_spin_isodose_ny", QSpinBox, (20, 200), 10,
+             cur.isodose_ny if cur else 80,
+             "sim_config_isodose_ny", "Y Resolution:"),
+        ])
 
         layout.addWidget(isodose_group)
 
@@ -133,19 +142,41 @@ class SimulationConfigDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def _add_spin_rows(self, form: QFormLayout, specs: list[tuple]) -> list[QWidget]:
+        """Create spin boxes from *specs* and add them as rows of *form*.
+
+        Each spec is ``(attr, factory, (min, max), step, value, i18n_key,
+        default_label)``; the widget is stored on ``self.<attr>``.
+
+        Returns:
+            The created spin boxes, in spec order.
+        """
+        widgets = []
+        for attr, factory, rng, step, value, key, default in specs:
+            w = factory()
+            w.setKeyboardTracking(False)
+            w.setRange(*rng)
+            w.setSingleStep(step)
+            w.setValue(value)
+            setattr(self, attr, w)
+            form.addRow(t(f"dialogs.{key}", default), w)
+            widgets.append(w)
+        return widgets
+
     def _on_scatter_toggled(self, enabled: bool) -> None:
-        """Enable/disable scatter sub-settings."""
-        self._spin_scatter_order.setEnabled(enabled)
-        self._spin_scatter_rays.setEnabled(enabled)
-        self._spin_min_energy.setEnabled(enabled)
+        """Show/hide scatter sub-settings."""
+        for w in self._scatter_rows:
+            self._scatter_form.setRowVisible(w, enabled)
 
     def _on_isodose_toggled(self, enabled: bool) -> None:
-        """Enable/disable isodose resolution settings."""
-        self._spin_isodose_nx.setEnabled(enabled)
-        self._spin_isodose_ny.setEnabled(enabled)
+        """Show/hide isodose resolution settings."""
+        for w in self._isodose_rows:
+            self._isodose_form.setRowVisible(w, enabled)
 
     def get_config(self) -> SimulationConfig:
         """Return SimulationConfig from current dialog values."""
+        if not self._built:
+            self._build_ui()
         compton_cfg = ComptonConfig(
             enabled=self._cb_scatter.isChecked(),
             max_scatter_order=self._spin_scatter_order.value(),
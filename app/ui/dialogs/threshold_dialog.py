@@ -9,7 +9,7 @@ Reference: FRD §4.3 FR-3.4.6.
 from __future__ import annotations
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QDialog, QVBoxLayout, QHBoxLayout,
     QPushButton, QDoubleSpinBox, QGroupBox, QFormLayout,
 )
 
@@ -37,39 +37,43 @@ class ThresholdDialog(QDialog):
         self.setWindowTitle(t("dialogs.threshold_title", "Quality Threshold Values"))
         self.setMinimumWidth(380)
         self._spins: dict[str, QDoubleSpinBox] = {}
+        self._reset_plan: list[tuple[QDoubleSpinBox, float]] = []
         self._current = current or dict(DEFAULT_THRESHOLDS)
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
 
-        # Penumbra group
-        pen_group = QGroupBox(t("dialogs.threshold_penumbra", "Penumbra [mm] (lower = better)"))
-        pen_form = QFormLayout(pen_group)
-        pen_form.addRow(t("dialogs.threshold_excellent_le", "Excellent <="), self._spin("penumbra_excellent", 0.1, 50.0))
-        pen_form.addRow(t("dialogs.threshold_acceptable_le", "Acceptable <="), self._spin("penumbra_acceptable", 0.1, 100.0))
-        layout.addWidget(pen_group)
-
-        # Flatness group
-        flat_group = QGroupBox(t("dialogs.threshold_flatness", "Flatness [%] (lower = better)"))
-        flat_form = QFormLayout(flat_group)
-        flat_form.addRow(t("dialogs.threshold_excellent_le", "Excellent <="), self._spin("flatness_excellent", 0.1, 50.0))
-        flat_form.addRow(t("dialogs.threshold_acceptable_le", "Acceptable <="), self._spin("flatness_acceptable", 0.1, 100.0))
-        layout.addWidget(flat_group)
-
-        # Leakage group
-        leak_group = QGroupBox(t("dialogs.threshold_leakage", "Leakage [%] (lower = better)"))
-        leak_form = QFormLayout(leak_group)
-        leak_form.addRow(t("dialogs.threshold_excellent_le", "Excellent <="), self._spin("leakage_excellent", 0.001, 50.0))
-        leak_form.addRow(t("dialogs.threshold_acceptable_le", "Acceptable <="), self._spin("leakage_acceptable", 0.01, 100.0))
-        layout.addWidget(leak_group)
-
-        # CR group
-        cr_group = QGroupBox(t("dialogs.threshold_cr", "Collim. Ratio [dB] (higher = better)"))
-        cr_form = QFormLayout(cr_group)
-        cr_form.addRow(t("dialogs.threshold_excellent_ge", "Excellent >="), self._spin("cr_excellent", 1.0, 100.0))
-        cr_form.addRow(t("dialogs.threshold_acceptable_ge", "Acceptable >="), self._spin("cr_acceptable", 1.0, 100.0))
-        layout.addWidget(cr_group)
+        excellent_le = t("dialogs.threshold_excellent_le", "Excellent <=")
+        acceptable_le = t("dialogs.threshold_acceptable_le", "Acceptable <=")
+        excellent_ge = t("dialogs.threshold_excellent_ge", "Excellent >=")
+        acceptable_ge = t("dialogs.threshold_acceptable_ge", "Acceptable >=")
+
+        # (group title, [(key, min, max, row label), ...])
+        groups = (
+            (t("dialogs.threshold_penumbra", "Penumbra [mm] (lower = better)"), (
+                ("penumbra_excellent", 0.1, 50.0, excellent_le),
+                ("penumbra_acceptable", 0.1, 100.0, acceptable_le),
+            )),
+            (t("dialogs.threshold_flatness", "Flatness [%] (lower = better)"), (
+                ("flatness_excellent", 0.1, 50.0, excellent_le),
+                ("flatness_acceptable", 0.1, 100.0, acceptable_le),
+            )),
+            (t("dialogs.threshold_leakage", "Leakage [%] (lower = better)"), (
+                ("leakage_excellent", 0.001, 50.0, excellent_le),
+                ("leakage_acceptable", 0.01, 100.0, acceptable_le),
+            )),
+            (t("dialogs.threshold_cr", "Collim. Ratio [dB] (higher = better)"), (
+                ("cr_excellent", 1.0, 100.0, excellent_ge),
+                ("cr_acceptable", 1.0, 100.0, acceptable_ge),
+            )),
+        )
+        for title, rows in groups:
+            group = QGroupBox(title)
+            form = QFormLayout(group)
+            for key, min_val, max_val, label in rows:
+                form.addRow(label, self._spin(key, min_val, max_val))
+            layout.addWidget(group)
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -87,17 +91,22 @@ class ThresholdDialog(QDialog):
 
     def _spin(self, key: str, min_val: float, max_val: float) -> QDoubleSpinBox:
         spin = QDoubleSpinBox()
+        spin.setKeyboardTracking(False)
         spin.setRange(min_val, max_val)
         spin.setDecimals(2)
         spin.setSingleStep(0.5)
         spin.setValue(self._current.get(key, DEFAULT_THRESHOLDS[key]))
         self._spins[key] = spin
+        self._reset_plan.append((spin, DEFAULT_THRESHOLDS[key]))
         return spin
 
     def _reset_defaults(self) -> None:
-        for key, val in DEFAULT_THRESHOLDS.items():
-            if key in self._spins:
-                self._spins[key].setValue(val)
+        self.setUpdatesEnabled(False)
+        try:
+            for spin, val in self._reset_plan:
+                spin.setValue(val)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def get_thresholds(self) -> dict[str, float]:
         """Return current threshold values."""
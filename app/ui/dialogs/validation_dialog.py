@@ -6,30 +6,110 @@ status and a button to export as PDF report.
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
+import time
+from datetime import datetime as _dt
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtWidgets import (
     QDialog,
-    QDialogButtonBox,
     QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
-from app.core.i18n import t
+from app.core.i18n import t, t_many
 from app.core.validation_runner import ValidationSummary
-from app.workers.validation_worker import ValidationWorker
+from app.workers.validation_worker import (
+    RenderedRow,
+    ValidationReportWorker,
+    ValidationWorker,
+)
+
+
+_PASS_BRUSH = QBrush(QColor("#DCFCE7"))
+_FAIL_BRUSH = QBrush(QColor("#FEE2E2"))
+_SKIP_BRUSH = QBrush(QColor("#FEF9C3"))
+
+_STATUS_TEXT = {"pass": "PASS", "fail": "FAIL", "skip": "SKIP"}
+_STATUS_BG = {"pass": _PASS_BRUSH, "fail": _FAIL_BRUSH, "skip": _SKIP_BRUSH}
+
+# (i18n key, English default) per results column
+_COLUMN_HEADERS = (
+    ("dialogs.validation_col_test_id", "Test ID"),
+    ("dialogs.validation_col_group", "Group"),
+    ("dialogs.validation_col_ours", "Ours"),
+    ("dialogs.validation_col_reference", "Reference"),
+    ("dialogs.validation_col_diff", "Diff%"),
+    ("dialogs.validation_col_tolerance", "Tolerance%"),
+    ("dialogs.validation_col_status", "Status"),
+)
+
+# Per-column TextAlignmentRole values (numeric columns right, status centred)
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_COLUMN_ALIGN = (None, None, _ALIGN_RIGHT, _ALIGN_RIGHT, _ALIGN_RIGHT, _ALIGN_RIGHT, _ALIGN_CENTER)
+
+# Minimum interval [s] between progress repaints at the same percentage
+_PROGRESS_MIN_INTERVAL_S = 0.033
+
+# Initial widths [px] for Test ID, Group, Ours, Reference, Diff%, Tolerance%
+# (Status stretches to fill)
+_COLUMN_WIDTHS = (190, 60, 100, 100, 80, 90)
 
 
-_PASS_COLOR = QColor("#DCFCE7")
-_FAIL_COLOR = QColor("#FEE2E2")
-_SKIP_COLOR = QColor("#FEF9C3")
+class _ValidationResultsModel(QAbstractTableModel):
+    """Read-only table model over pre-formatted validation result rows.
+
+    Rows come from ``render_results`` (formatted on the worker thread);
+    ``data()`` only indexes into them.
+    """
+
+    _COLUMNS = 7
+
+    def __init__(self, headers: list[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: list[RenderedRow] = []
+
+    def set_rows(self, rows: list[RenderedRow]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._COLUMNS
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _STATUS_TEXT[row[6]] if col == 6 else row[col]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _COLUMN_ALIGN[col]
+        if role == Qt.ItemDataRole.BackgroundRole and col == 6:
+            return _STATUS_BG[row[6]]
+        return None
 
 
 class ValidationDialog(QDialog):
@@ -43,6 +123,13 @@ class ValidationDialog(QDialog):
 
         self._summary: ValidationSummary | None = None
         self._worker: ValidationWorker | None = None
+        self._report_worker: ValidationReportWorker | None = None
+        # Every worker started, by token, until its finished handler runs
+        self._workers: dict[int, ValidationWorker | ValidationReportWorker] = {}
+        self._last_token = 0
+        self._last_pct = -1
+        self._last_status_style = ""
+        self._last_progress_ts = 0.0
         self._build_ui()
         self._start_validation()
 
@@ -58,21 +145,18 @@ class ValidationDialog(QDialog):
         layout.addWidget(self._lbl_status)
 
         # Results table (hidden until complete)
-        self._table = QTableWidget()
-        self._table.setColumnCount(7)
-        self._table.setHorizontalHeaderLabels([
-            t("dialogs.validation_col_test_id", "Test ID"),
-            t("dialogs.validation_col_group", "Group"),
-            t("dialogs.validation_col_ours", "Ours"),
-            t("dialogs.validation_col_reference", "Reference"),
-            t("dialogs.validation_col_diff", "Diff%"),
-            t("dialogs.validation_col_tolerance", "Tolerance%"),
-            t("dialogs.validation_col_status", "Status"),
-        ])
-        self._table.horizontalHeader().setStretchLastSection(True)
+        self._model = _ValidationResultsModel(t_many(_COLUMN_HEADERS), self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        # Fixed initial widths; content-based sizing would measure every cell
+        for col, width in enumerate(_COLUMN_WIDTHS):
+            self._table.setColumnWidth(col, width)
         self._table.setAlternatingRowColors(True)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self._table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self._table.setVisible(False)
         layout.addWidget(self._table)
 
@@ -101,27 +185,64 @@ class ValidationDialog(QDialog):
     # Validation execution
     # ------------------------------------------------------------------
 
+    def _next_token(self) -> int:
+        self._last_token += 1
+        return self._last_token
+
     def _start_validation(self) -> None:
-        self._worker = ValidationWorker(self)
+        self._worker = ValidationWorker(self._next_token())
+        self._workers[self._worker.token] = self._worker
         self._worker.progress.connect(self._on_progress)
         self._worker.result_ready.connect(self._on_result)
         self._worker.error_occurred.connect(self._on_error)
         self._worker.finished.connect(self._on_worker_finished)
         self._worker.start()
 
-    def _on_worker_finished(self) -> None:
-        worker = self._worker
-        self._worker = None
+    def reset_and_run(self) -> None:
+        """Clear the previous results and start a new validation run.
+
+        Lets the owner keep one dialog instance and re-run it instead of
+        rebuilding the widgets on every open.
+        """
+        self._cancel_worker()
+        self._summary = None
+        self._model.set_rows([])
+        self._table.setVisible(False)
+        self._btn_pdf.setEnabled(False)
+        self._lbl_summary.setText("")
+        self._set_status_style("")
+        self._lbl_status.setText(t("dialogs.validation_starting", "Starting validation tests..."))
+        self._last_pct = -1
+        self._progress_bar.setValue(0)
+        self._progress_bar.setVisible(True)
+        self._start_validation()
+
+    def _release_worker(self, token: int) -> None:
+        worker = self._workers.pop(token, None)
         if worker is not None:
             worker.deleteLater()
 
+    def _on_worker_finished(self, token: int) -> None:
+        self._release_worker(token)
+        # A cancelled run from a previous open may finish after a new one started
+        if self._worker is not None and self._worker.token == token:
+            self._worker = None
+
     def _on_progress(self, pct: int, test_id: str) -> None:
-        self._progress_bar.setValue(pct)
+        # Coalesce bursts of short tests: same percentage within ~30 ms
+        # would only repaint the status label again
+        now = time.monotonic()
+        if pct == self._last_pct and now - self._last_progress_ts < _PROGRESS_MIN_INTERVAL_S:
+            return
+        self._last_progress_ts = now
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress_bar.setValue(pct)
         self._lbl_status.setText(
             t("dialogs.validation_running", "Running test: {test_id}").format(test_id=test_id)
         )
 
-    def _on_result(self, summary: ValidationSummary) -> None:
+    def _on_result(self, summary: ValidationSummary, rows: list[RenderedRow]) -> None:
         self._summary = summary
         self._progress_bar.setValue(100)
         self._progress_bar.setVisible(False)
@@ -133,14 +254,14 @@ class ValidationDialog(QDialog):
                   "Validation complete \u2014 ALL TESTS PASSED ({duration:.1f}s)").format(
                     duration=summary.duration_s)
             )
-            self._lbl_status.setStyleSheet("color: #166534; font-weight: bold;")
+            self._set_status_style("color: #166534; font-weight: bold;")
         else:
             self._lbl_status.setText(
                 t("dialogs.validation_some_fail",
                   "Validation complete \u2014 {failed} TEST(S) FAILED ({duration:.1f}s)").format(
                     failed=summary.failed, duration=summary.duration_s)
             )
-            self._lbl_status.setStyleSheet("color: #991B1B; font-weight: bold;")
+            self._set_status_style("color: #991B1B; font-weight: bold;")
 
         # Summary
         xraylib_str = 'v' + summary.xraylib_version if summary.xraylib_available else t("common.none", "none")
@@ -158,39 +279,8 @@ class ValidationDialog(QDialog):
         )
 
         # Populate table
-        self._table.setRowCount(len(summary.results))
-        for row, r in enumerate(summary.results):
-            # Test ID
-            self._table.setItem(row, 0, QTableWidgetItem(r.test_id))
-            self._table.setItem(row, 1, QTableWidgetItem(r.group))
-
-            # Values
-            ours_s = self._fmt(r.our_value)
-            ref_s = self._fmt(r.ref_value)
-            diff_s = f"{r.diff_pct:.2f}" if not r.skipped else "-"
-            tol_s = f"{r.tolerance_pct:.1f}" if r.tolerance_pct > 0 else "exact"
-
-            self._table.setItem(row, 2, self._aligned_item(ours_s))
-            self._table.setItem(row, 3, self._aligned_item(ref_s))
-            self._table.setItem(row, 4, self._aligned_item(diff_s))
-            self._table.setItem(row, 5, self._aligned_item(tol_s))
-
-            # Status with color
-            if r.skipped:
-                status_item = QTableWidgetItem("SKIP")
-                bg = _SKIP_COLOR
-            elif r.passed:
-                status_item = QTableWidgetItem("PASS")
-                bg = _PASS_COLOR
-            else:
-                status_item = QTableWidgetItem("FAIL")
-                bg = _FAIL_COLOR
-
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setBackground(bg)
-            self._table.setItem(row, 6, status_item)
-
-        self._table.resizeColumnsToContents()
+        self._model.set_rows(rows)
+
         self._table.setVisible(True)
         self._btn_pdf.setEnabled(True)
 
@@ -199,7 +289,13 @@ class ValidationDialog(QDialog):
         self._lbl_status.setText(
             t("common.error", "Error") + f": {error}"
         )
-        self._lbl_status.setStyleSheet("color: #991B1B;")
+        self._set_status_style("color: #991B1B;")
+
+    def _set_status_style(self, style: str) -> None:
+        # setStyleSheet re-polishes the label even when the sheet is unchanged
+        if style != self._last_status_style:
+            self._last_status_style = style
+            self._lbl_status.setStyleSheet(style)
 
     # ------------------------------------------------------------------
     # PDF export
@@ -209,8 +305,7 @@ class ValidationDialog(QDialog):
         if self._summary is None:
             return
 
-        from datetime import datetime as dt
-        default_name = f"CDT_Validation_{dt.now().strftime('%Y%m%d_%H%M')}.pdf"
+        default_name = f"CDT_Validation_{_dt.now().strftime('%Y%m%d_%H%M')}.pdf"
 
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -221,44 +316,63 @@ class ValidationDialog(QDialog):
         if not path:
             return
 
-        try:
-            from app.export.validation_report import ValidationReportExporter
-            exporter = ValidationReportExporter()
-            exporter.generate_report(self._summary, path)
-            QMessageBox.information(
-                self,
-                t("common.success", "Success"),
-                t("dialogs.validation_report_saved",
-                  "Validation report saved:\n{path}").format(path=path),
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                t("common.error", "Error"),
-                t("dialogs.validation_report_error",
-                  "Could not create PDF:\n{error}").format(error=e),
-            )
+        # reportlab build runs on a pool thread; the button stays disabled
+        # until it finishes so only one report is written at a time
+        self._btn_pdf.setEnabled(False)
+        self._report_worker = ValidationReportWorker(
+            self._summary, path, self._next_token(),
+        )
+        self._workers[self._report_worker.token] = self._report_worker
+        self._report_worker.result_ready.connect(self._on_report_saved)
+        self._report_worker.error_occurred.connect(self._on_report_error)
+        self._report_worker.finished.connect(self._on_report_finished)
+        self._report_worker.start()
+
+    def _on_report_saved(self, path: str) -> None:
+        QMessageBox.information(
+            self,
+            t("common.success", "Success"),
+            t("dialogs.validation_report_saved",
+              "Validation report saved:\n{path}").format(path=path),
+        )
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
+    def _on_report_error(self, error: str) -> None:
+        QMessageBox.critical(
+            self,
+            t("common.error", "Error"),
+            t("dialogs.validation_report_error",
+              "Could not create PDF:\n{error}").format(error=error),
+        )
+
+    def _on_report_finished(self, token: int) -> None:
+        self._release_worker(token)
+        self._report_worker = None
+        self._btn_pdf.setEnabled(self._summary is not None)
 
-    @staticmethod
-    def _fmt(val: float) -> str:
-        if val == 0:
-            return "0"
-        if abs(val) < 0.001 or abs(val) > 1e4:
-            return f"{val:.4e}"
-        return f"{val:.4f}"
+    def _cancel_worker(self) -> None:
+        # The runner checks the flag between tests; no need to block here
+        if self._worker is not None:
+            self._worker.cancel()
 
-    @staticmethod
-    def _aligned_item(text: str) -> QTableWidgetItem:
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        return item
+    def shutdown(self, timeout_ms: int) -> None:
+        """Cancel the run and wait up to *timeout_ms* for pool tasks still going.
+
+        Called by the owner before the application quits or the dialog is
+        dropped, so no validation run (including cancelled ones from
+        earlier opens) or report build outlives the objects it reports to.
+        The bound is shared by all of them.
+        """
+        self._cancel_worker()
+        deadline = time.monotonic() + timeout_ms / 1000
+        for worker in list(self._workers.values()):
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            worker.wait(remaining_ms)
+
+    def done(self, result: int) -> None:
+        # Close button / Escape go through accept()/reject(), not closeEvent
+        self._cancel_worker()
+        super().done(result)
 
     def closeEvent(self, event) -> None:
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait(3000)
+        self._cancel_worker()
         super().closeEvent(event)
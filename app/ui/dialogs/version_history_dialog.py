@@ -3,13 +3,68 @@
 Reference: Phase-06 spec — FR-1.6.3.
 """
 
+from typing import Callable
+
 from PyQt6.QtWidgets import (
     QDialog, QHBoxLayout, QHeaderView, QPushButton,
-    QTableWidget, QTableWidgetItem, QVBoxLayout,
+    QTableView, QVBoxLayout,
 )
+from PyQt6.QtCore import QModelIndex, Qt
 
 from app.core.i18n import t
 from app.database.design_repository import DesignRepository
+from app.models.design import DesignVersion
+from app.ui.widgets.paged_model import KeysetPagedModel
+
+
+_VERSIONS_PAGE_SIZE = 50
+
+
+class _VersionHistoryModel(KeysetPagedModel):
+    """Read-only table model over ``get_version_history`` rows, newest first.
+
+    Paged by version number (``_VERSIONS_PAGE_SIZE`` versions per page).
+    """
+
+    _COLUMNS = 3
+
+    def __init__(
+        self,
+        headers: list[str],
+        fetch_page: Callable[[int | None], list[DesignVersion]],
+        parent=None,
+    ):
+        super().__init__(fetch_page, _VERSIONS_PAGE_SIZE, parent)
+        self._headers = headers
+
+    @property
+    def versions(self) -> list[DesignVersion]:
+        return self._rows
+
+    def _page_key(self, version: DesignVersion) -> int:
+        return version.version_number
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._COLUMNS
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        v = self._rows[index.row()]
+        col = index.column()
+        if col == 0:
+            return str(v.version_number)
+        if col == 1:
+            return v.created_at[:16]
+        return v.change_note
 
 
 class VersionHistoryDialog(QDialog):
@@ -35,16 +90,16 @@ class VersionHistoryDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Version table
-        self._table = QTableWidget()
-        self._table.setColumnCount(3)
-        self._table.setHorizontalHeaderLabels([
+        self._model = _VersionHistoryModel([
             t("dialogs.version_col_version", "Version"),
             t("dialogs.version_col_date", "Date"),
             t("dialogs.version_col_note", "Change Note"),
-        ])
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        ], self._fetch_versions_page, self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self._table.horizontalHeader().setSectionResizeMode(
             2, QHeaderView.ResizeMode.Stretch
         )
@@ -64,23 +119,24 @@ class VersionHistoryDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
-        self._versions = []
         self._refresh()
 
     def _refresh(self) -> None:
-        """Load version history from DB."""
-        self._versions = self._repo.get_version_history(self._design_id)
-        self._table.setRowCount(len(self._versions))
-        for row, v in enumerate(self._versions):
-            self._table.setItem(row, 0, QTableWidgetItem(str(v.version_number)))
-            self._table.setItem(row, 1, QTableWidgetItem(v.created_at[:16]))
-            self._table.setItem(row, 2, QTableWidgetItem(v.change_note))
+        """Reload version history from DB (first page)."""
+        self._model.reload()
+
+    def _fetch_versions_page(self, before_version: int | None) -> list[DesignVersion]:
+        """Fetch one page of versions older than *before_version*."""
+        return self._repo.get_version_history(
+            self._design_id,
+            limit=_VERSIONS_PAGE_SIZE, before_version=before_version,
+        )
 
     def _on_restore(self) -> None:
         rows = self._table.selectionModel().selectedRows()
         if rows:
             row = rows[0].row()
-            ver = self._versions[row]
+            ver = self._model.versions[row]
             self._repo.restore_version(self._design_id, ver.version_number)
             self.restored_version = ver.version_number
             self.accept()
@@ -7,6 +7,7 @@ Bottom: Aperture configuration
 Reference: Phase-03 spec — FR-1.4, Stage/Layer Management.
 """
 
+import functools
 import math
 
 from PyQt6.QtWidgets import (
@@ -14,13 +15,16 @@ from PyQt6.QtWidgets import (
     QPushButton, QLineEdit, QFrame,
 )
 
+from app.ui.widgets.material_combo import MATERIAL_INDEX, make_material_combo
+from app.ui.widgets.signal_blockers import MultiBlocker
 from app.ui.widgets.smart_spinbox import SmartDoubleSpinBox
-from PyQt6.QtCore import Qt, QSignalBlocker
+from PyQt6.QtCore import Qt, QRectF, QSignalBlocker, QTimer
+from PyQt6.QtGui import QColor, QPainter, QPixmap
 
-from app.constants import MATERIAL_IDS, MAX_STAGES, MIN_STAGES, MATERIAL_MIME_TYPE
+from app.constants import MAX_STAGES, MIN_STAGES
 from app.core.i18n import t, TranslationManager
 from app.models.geometry import (
-    StagePurpose, ApertureConfig, CollimatorType,
+    StagePurpose, ApertureConfig, CollimatorStage, CollimatorType,
 )
 from app.ui.canvas.geometry_controller import GeometryController
 from app.ui.styles.colors import MATERIAL_COLORS
@@ -37,9 +41,96 @@ _PURPOSE_DEFAULTS: dict[str, str] = {
 }
 
 
-def _get_purpose_name(purpose: StagePurpose) -> str:
+# Aperture rows: key -> (i18n key, default label, (min, max), suffix)
+_APERTURE_ROW_SPECS: dict[str, tuple[str, str, tuple[float, float], str]] = {
+    "fan_angle": ("aperture.angle", "Angle:", (1, 90), "\u00B0"),
+    "fan_slit": ("aperture.slit_width", "Slit:", (0.1, 100), ""),
+    "pencil_d": ("aperture.diameter", "Diameter:", (0.1, 100), ""),
+    "slit_in": ("aperture.entry", "Entry:", (0.1, 200), ""),        # source side
+    "slit_out": ("aperture.exit", "Exit:", (0.1, 200), ""),         # detector side
+}
+
+# Panel-wide stylesheet, applied once instead of per widget
+_PANEL_QSS = """
+QComboBox, QComboBox QAbstractItemView, QLineEdit { font-size: 8pt; }
+QLabel[cssClass="prop-label"] { min-width: 40px; max-width: 40px; }
+QLabel#stageHeader, QLabel#apertureHeader {
+    color: #F8FAFC; font-weight: bold; font-size: 8pt;
+}
+QLabel#dimHeader {
+    color: #94A3B8; font-size: 7pt; font-weight: bold; margin-top: 2px;
+}
+"""
+
+# Delay [ms] for coalescing spinbox edits before they reach the controller
+_EDIT_FLUSH_MS = 16
+
+# Panel sections a deferred refresh has to update (bit mask)
+_DIRTY_STAGES = 0x1     # stage combo + add/remove/move buttons
+_DIRTY_PROPS = 0x2
+_DIRTY_APERTURE = 0x4
+_DIRTY_ALL = _DIRTY_STAGES | _DIRTY_PROPS | _DIRTY_APERTURE
+
+# Combo row for each purpose (the combo is filled in this order)
+_PURPOSE_INDEX: dict[StagePurpose, int] = {p: i for i, p in enumerate(StagePurpose)}
+
+# i18n key for each purpose name
+_PURPOSE_KEYS: dict[StagePurpose, str] = {
+    p: f"stage_purpose.{p.name}" for p in StagePurpose
+}
+
+# Material colour swatch: side [px] and colour for unknown materials
+_SWATCH_SIZE = 14
+_SWATCH_DEFAULT_COLOR = "#64748B"
+
+
+def _set_spin_value(spin: SmartDoubleSpinBox, value: float) -> None:
+    """setValue() unless *spin* already shows *value* at its precision."""
+    if abs(spin.value() - value) > 0.5 * 10 ** -spin.decimals():
+        spin.setValue(value)
+
+
+def _set_combo_index(combo: QComboBox, index: int) -> None:
+    """setCurrentIndex() unless *combo* is already at *index*."""
+    if combo.currentIndex() != index:
+        combo.setCurrentIndex(index)
+
+
+@functools.lru_cache(maxsize=64)
+def _swatch_pixmap(material_id: str, dpr: float) -> QPixmap:
+    """Rounded colour swatch for *material_id*, painted once per material.
+
+    Shown with QLabel.setPixmap, so switching materials is a blit rather
+    than a stylesheet reparse and re-polish.
+    """
+    side = round(_SWATCH_SIZE * dpr)
+    pixmap = QPixmap(side, side)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(MATERIAL_COLORS.get(material_id, _SWATCH_DEFAULT_COLOR)))
+    painter.drawRoundedRect(QRectF(0, 0, side, side), 2 * dpr, 2 * dpr)
+    painter.end()
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+@functools.lru_cache(maxsize=256)
+def _tan_deg(deg: float) -> float:
+    """tan() of an angle in degrees, memoized on the exact taper value."""
+    return math.tan(math.radians(deg))
+
+
+@functools.lru_cache(maxsize=64)
+def _purpose_name(purpose: StagePurpose, lang_gen: int) -> str:
+    """Translated purpose name, memoized per language (*lang_gen*)."""
     default = _PURPOSE_DEFAULTS.get(purpose.name, purpose.name)
-    return t(f"stage_purpose.{purpose.name}", default)
+    return t(_PURPOSE_KEYS[purpose], default)
+
+
+def _get_purpose_name(purpose: StagePurpose) -> str:
+    return _purpose_name(purpose, TranslationManager.lang_gen)
 
 
 class LayerPanel(QWidget):
@@ -52,26 +143,68 @@ class LayerPanel(QWidget):
     ):
         super().__init__(parent)
         self._controller = controller
+        self._combo_signature: tuple[str, ...] | None = None
+        self._last_swatch_id: str | None = None
+        self._aperture_signature: tuple = ()
+        self._in_refresh = False
+        self._suppress_self_refresh = False
+
+        # Per collimator type: refresh widgets from a stage / build an
+        # ApertureConfig from the widgets
+        self._aperture_refreshers = {
+            CollimatorType.FAN_BEAM: self._refresh_fan_aperture,
+            CollimatorType.PENCIL_BEAM: self._refresh_pencil_aperture,
+            CollimatorType.SLIT: self._refresh_slit_aperture,
+        }
+        self._aperture_builders = {
+            CollimatorType.FAN_BEAM: self._build_fan_aperture,
+            CollimatorType.PENCIL_BEAM: self._build_pencil_aperture,
+            CollimatorType.SLIT: self._build_slit_aperture,
+        }
+
+        # Spinbox edits are queued and flushed to the controller once per
+        # frame (last value wins), so spinning a value does not push every
+        # intermediate step through stage_changed and the undo stack.
+        # Spin boxes have keyboard tracking off: typed text is committed
+        # on Enter/focus-out, not once per keystroke
+        self._pending_stage = -1
+        self._pending_dims: dict[str, float] = {}
+        self._pending_aperture: ApertureConfig | None = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_EDIT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_edits)
+
+        # Controller signals only mark sections dirty; a zero-delay timer
+        # refreshes them once, so a burst of emissions (e.g. geometry_changed
+        # followed by collimator_type_changed) costs a single pass
+        self._dirty = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._apply_dirty)
+        # Fill the widgets before any slot is connected, so the initial
+        # values cannot echo back to the controller
         self._build_ui()
-        self._connect_signals()
         self._refresh_all()
-        TranslationManager.on_language_changed(self.retranslate_ui)
+        self._attached = False
+        self._connect_signals()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(6)
+        self.setStyleSheet(_PANEL_QSS)
 
         # --- Stage selector ---
         self._lbl_stage_header = QLabel(t("panels.stage_selection", "Stage Selection"))
-        self._lbl_stage_header.setStyleSheet("color: #F8FAFC; font-weight: bold; font-size: 8pt;")
+        self._lbl_stage_header.setObjectName("stageHeader")
         layout.addWidget(self._lbl_stage_header)
 
         stage_row = QHBoxLayout()
         stage_row.setSpacing(4)
 
         self._stage_combo = QComboBox()
-        self._stage_combo.setStyleSheet("font-size: 8pt;")
         stage_row.addWidget(self._stage_combo, 1)
 
         self._btn_add_stage = QPushButton("+")
@@ -112,7 +245,6 @@ class LayerPanel(QWidget):
         self._lbl_name = self._make_label(t("panels.name", "Name:"))
         name_row.addWidget(self._lbl_name)
         self._edit_name = QLineEdit()
-        self._edit_name.setStyleSheet("font-size: 8pt;")
         name_row.addWidget(self._edit_name)
         props_layout.addLayout(name_row)
 
@@ -121,7 +253,6 @@ class LayerPanel(QWidget):
         self._lbl_purpose = self._make_label(t("panels.purpose", "Purpose:"))
         purpose_row.addWidget(self._lbl_purpose)
         self._combo_purpose = QComboBox()
-        self._combo_purpose.setStyleSheet("font-size: 8pt;")
         for p in StagePurpose:
             self._combo_purpose.addItem(_get_purpose_name(p), p)
         purpose_row.addWidget(self._combo_purpose)
@@ -129,9 +260,7 @@ class LayerPanel(QWidget):
 
         # Dimensions sub-header
         self._lbl_dim_header = QLabel(t("panels.dimensions_mm", "Dimensions (mm)"))
-        self._lbl_dim_header.setStyleSheet(
-            "color: #94A3B8; font-size: 7pt; font-weight: bold; margin-top: 2px;"
-        )
+        self._lbl_dim_header.setObjectName("dimHeader")
         props_layout.addWidget(self._lbl_dim_header)
 
         # Dimensions row (G = width, T = thickness/height)
@@ -142,6 +271,7 @@ class LayerPanel(QWidget):
         self._spin_width.setRange(0.5, 1000)
         self._spin_width.setSingleStep(0.5)
         self._spin_width.setDecimals(2)
+        self._spin_width.setKeyboardTracking(False)
         dim_row.addWidget(self._spin_width)
 
         self._lbl_height = self._make_label(t("panels.outer_height", "T (thickness):"))
@@ -150,6 +280,7 @@ class LayerPanel(QWidget):
         self._spin_height.setRange(0.5, 1000)
         self._spin_height.setSingleStep(0.5)
         self._spin_height.setDecimals(2)
+        self._spin_height.setKeyboardTracking(False)
         dim_row.addWidget(self._spin_height)
         props_layout.addLayout(dim_row)
 
@@ -161,6 +292,7 @@ class LayerPanel(QWidget):
         self._spin_x_offset.setRange(-2000, 2000)
         self._spin_x_offset.setSingleStep(1.0)
         self._spin_x_offset.setDecimals(2)
+        self._spin_x_offset.setKeyboardTracking(False)
         pos_row.addWidget(self._spin_x_offset)
 
         self._lbl_y = self._make_label(t("panels.y_pos", "Y:"))
@@ -169,6 +301,7 @@ class LayerPanel(QWidget):
         self._spin_y_position.setRange(-2000, 2000)
         self._spin_y_position.setSingleStep(1.0)
         self._spin_y_position.setDecimals(2)
+        self._spin_y_position.setKeyboardTracking(False)
         pos_row.addWidget(self._spin_y_position)
         props_layout.addLayout(pos_row)
 
@@ -176,26 +309,31 @@ class LayerPanel(QWidget):
         mat_row = QHBoxLayout()
         self._lbl_material = self._make_label(t("panels.material", "Material:"))
         mat_row.addWidget(self._lbl_material)
-        self._combo_material = QComboBox()
-        self._combo_material.setStyleSheet("font-size: 8pt;")
-        for mid in MATERIAL_IDS:
-            self._combo_material.addItem(mid, mid)
+        self._combo_material = make_material_combo()
         mat_row.addWidget(self._combo_material)
 
         # Material color swatch
         self._mat_swatch = QLabel()
-        self._mat_swatch.setFixedSize(14, 14)
-        self._mat_swatch.setStyleSheet("background: #64748B; border-radius: 2px;")
+        self._mat_swatch.setFixedSize(_SWATCH_SIZE, _SWATCH_SIZE)
+        self._mat_swatch.setPixmap(
+            _swatch_pixmap("", self._mat_swatch.devicePixelRatioF())
+        )
         mat_row.addWidget(self._mat_swatch)
         props_layout.addLayout(mat_row)
 
         layout.addWidget(props)
 
+        # Widgets written together by _refresh_stage_props
+        self._prop_widgets = (
+            self._edit_name, self._combo_purpose,
+            self._spin_width, self._spin_height,
+            self._spin_x_offset, self._spin_y_position,
+            self._combo_material,
+        )
+
         # --- Aperture ---
         self._lbl_aperture_header = QLabel(t("panels.aperture_mm", "Aperture (mm)"))
-        self._lbl_aperture_header.setStyleSheet(
-            "color: #F8FAFC; font-weight: bold; font-size: 8pt;"
-        )
+        self._lbl_aperture_header.setObjectName("apertureHeader")
         layout.addWidget(self._lbl_aperture_header)
 
         ap_frame = QFrame()
@@ -204,81 +342,83 @@ class LayerPanel(QWidget):
         ap_layout.setContentsMargins(6, 4, 6, 4)
         ap_layout.setSpacing(3)
 
-        # Fan angle
-        self._fan_row = QHBoxLayout()
-        self._fan_row_label = self._make_label(t("aperture.angle", "Angle:"))
-        self._fan_row.addWidget(self._fan_row_label)
-        self._spin_fan_angle = SmartDoubleSpinBox()
-        self._spin_fan_angle.setRange(1, 90)
-        self._spin_fan_angle.setSuffix("\u00B0")
-        self._spin_fan_angle.setDecimals(2)
-        self._spin_fan_angle.setSingleStep(0.5)
-        self._fan_row.addWidget(self._spin_fan_angle)
-        ap_layout.addLayout(self._fan_row)
-
-        # Fan slit width
-        self._fan_sw_row = QHBoxLayout()
-        self._fan_sw_label = self._make_label(t("aperture.slit_width", "Slit:"))
-        self._fan_sw_row.addWidget(self._fan_sw_label)
-        self._spin_fan_slit = SmartDoubleSpinBox()
-        self._spin_fan_slit.setRange(0.1, 100)
-        self._spin_fan_slit.setDecimals(2)
-        self._spin_fan_slit.setSingleStep(0.5)
-        self._fan_sw_row.addWidget(self._spin_fan_slit)
-        ap_layout.addLayout(self._fan_sw_row)
-
-        # Pencil diameter
-        self._pencil_row = QHBoxLayout()
-        self._pencil_label = self._make_label(t("aperture.diameter", "Diameter:"))
-        self._pencil_row.addWidget(self._pencil_label)
-        self._spin_pencil_d = SmartDoubleSpinBox()
-        self._spin_pencil_d.setRange(0.1, 100)
-        self._spin_pencil_d.setDecimals(2)
-        self._spin_pencil_d.setSingleStep(0.5)
-        self._pencil_row.addWidget(self._spin_pencil_d)
-        ap_layout.addLayout(self._pencil_row)
-
-        # Slit input width (source side)
-        self._slit_in_row = QHBoxLayout()
-        self._slit_in_label = self._make_label(t("aperture.entry", "Entry:"))
-        self._slit_in_row.addWidget(self._slit_in_label)
-        self._spin_slit_in = SmartDoubleSpinBox()
-        self._spin_slit_in.setRange(0.1, 200)
-        self._spin_slit_in.setDecimals(2)
-        self._spin_slit_in.setSingleStep(0.5)
-        self._slit_in_row.addWidget(self._spin_slit_in)
-        ap_layout.addLayout(self._slit_in_row)
-
-        # Slit output width (detector side)
-        self._slit_out_row = QHBoxLayout()
-        self._slit_out_label = self._make_label(t("aperture.exit", "Exit:"))
-        self._slit_out_row.addWidget(self._slit_out_label)
-        self._spin_slit_out = SmartDoubleSpinBox()
-        self._spin_slit_out.setRange(0.1, 200)
-        self._spin_slit_out.setDecimals(2)
-        self._spin_slit_out.setSingleStep(0.5)
-        self._slit_out_row.addWidget(self._spin_slit_out)
-        ap_layout.addLayout(self._slit_out_row)
+        # Rows are built on first use by _aperture_row(); most collimator
+        # types only ever show one or two of them
+        self._ap_layout = ap_layout
+        self._aperture_rows: dict[str, tuple[QLabel, SmartDoubleSpinBox]] = {}
 
         layout.addWidget(ap_frame)
         layout.addStretch()
 
+    def _aperture_row(self, key: str) -> SmartDoubleSpinBox:
+        """Return the spin box of aperture row *key*, building the row on first use."""
+        row = self._aperture_rows.get(key)
+        if row is None:
+            i18n_key, default, rng, suffix = _APERTURE_ROW_SPECS[key]
+            row_layout = QHBoxLayout()
+            label = self._make_label(t(i18n_key, default))
+            row_layout.addWidget(label)
+            spin = SmartDoubleSpinBox()
+            spin.setRange(*rng)
+            if suffix:
+                spin.setSuffix(suffix)
+            spin.setDecimals(2)
+            spin.setSingleStep(0.5)
+            spin.setKeyboardTracking(False)
+            spin.valueChanged.connect(
+                self._on_aperture_changed, Qt.ConnectionType.DirectConnection,
+            )
+            row_layout.addWidget(spin)
+            self._ap_layout.addLayout(row_layout)
+            row = self._aperture_rows[key] = (label, spin)
+        return row[1]
+
     def _make_label(self, text: str) -> QLabel:
+        # Width comes from the panel stylesheet (prop-label rule)
         lbl = QLabel(text)
         lbl.setProperty("cssClass", "prop-label")
-        lbl.setFixedWidth(40)
         return lbl
 
-    def _connect_signals(self) -> None:
+    def _controller_slots(self) -> tuple:
+        """(signal, slot) pairs linking the controller to this panel."""
         ctrl = self._controller
+        return (
+            (ctrl.geometry_changed, self._on_geometry_changed),
+            (ctrl.stage_changed, self._on_stage_changed),
+            # add/remove_stage emit only these, not geometry_changed
+            (ctrl.stage_added, self._on_stage_list_changed),
+            (ctrl.stage_removed, self._on_stage_list_changed),
+            (ctrl.stage_selected, self._on_stage_selected),
+            (ctrl.stage_position_changed, self._on_stage_position_changed),
+            (ctrl.collimator_type_changed, self._on_collimator_type_changed),
+        )
 
+    def _attach(self) -> None:
+        """Subscribe to controller signals and language changes."""
+        # Re-attached on every show; UniqueConnection makes a connection
+        # that is still in place raise TypeError instead of doubling up
+        unique = Qt.ConnectionType.UniqueConnection
+        for signal, slot in self._controller_slots():
+            try:
+                signal.connect(slot, unique)
+            except TypeError:
+                pass
+        TranslationManager.on_language_changed(self.retranslate_ui)
+        self._attached = True
+
+    def _detach(self) -> None:
+        """Undo :meth:`_attach` so a hidden panel does no refresh work."""
+        for signal, slot in self._controller_slots():
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        TranslationManager.remove_listener(self.retranslate_ui)
+        self._attached = False
+
+    def _connect_signals(self) -> None:
         # Controller -> panel
-        ctrl.geometry_changed.connect(self._refresh_all)
-        ctrl.stage_changed.connect(self._on_stage_changed)
-        ctrl.stage_added.connect(lambda _: self._refresh_all())
-        ctrl.stage_removed.connect(lambda _: self._refresh_all())
-        ctrl.stage_selected.connect(self._on_stage_selected)
-        ctrl.stage_position_changed.connect(self._on_stage_position_changed)
+        self._attach()
 
         # Panel widgets -> controller
         self._stage_combo.currentIndexChanged.connect(self._on_stage_combo_changed)
@@ -294,15 +434,26 @@ class LayerPanel(QWidget):
         self._spin_y_position.valueChanged.connect(self._on_y_position_changed)
         self._combo_material.currentIndexChanged.connect(self._on_material_changed)
 
-        # Aperture
-        self._spin_fan_angle.valueChanged.connect(self._on_aperture_changed)
-        self._spin_fan_slit.valueChanged.connect(self._on_aperture_changed)
-        self._spin_pencil_d.valueChanged.connect(self._on_aperture_changed)
-        self._spin_slit_in.valueChanged.connect(self._on_aperture_changed)
-        self._spin_slit_out.valueChanged.connect(self._on_aperture_changed)
+        # Aperture spin boxes connect themselves in _aperture_row()
 
-        ctrl.stage_changed.connect(lambda _: self._refresh_aperture())
-        ctrl.collimator_type_changed.connect(lambda _: self._refresh_aperture())
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def set_active(self, active: bool) -> None:
+        """Start or stop following the controller as the panel is shown/hidden.
+
+        Connected by the owner to its dock's ``visibilityChanged``. When
+        hidden, pending edits are committed and the panel stops listening;
+        when shown again it re-subscribes and catches up on missed changes.
+        """
+        if active and not self._attached:
+            self._attach()
+            self.retranslate_ui()
+            self._refresh_all()
+        elif not active and self._attached:
+            self._flush_pending_edits()
+            self._detach()
 
     # ------------------------------------------------------------------
     # Retranslation
@@ -322,28 +473,20 @@ class LayerPanel(QWidget):
         self._lbl_y.setText(t("panels.y_pos", "Y:"))
         self._lbl_material.setText(t("panels.material", "Material:"))
 
-        # Purpose combo — repopulate with translated names
+        # Purpose combo — translated names
         self._lbl_purpose.setText(t("panels.purpose", "Purpose:"))
-        current_purpose = self._combo_purpose.currentData()
-        with QSignalBlocker(self._combo_purpose):
-            self._combo_purpose.clear()
-            for p in StagePurpose:
-                self._combo_purpose.addItem(_get_purpose_name(p), p)
-            if current_purpose is not None:
-                for i in range(self._combo_purpose.count()):
-                    if self._combo_purpose.itemData(i) == current_purpose:
-                        self._combo_purpose.setCurrentIndex(i)
-                        break
+        # Items keep their order/data, so only the texts are replaced and
+        # the current index is untouched
+        for p, i in _PURPOSE_INDEX.items():
+            self._combo_purpose.setItemText(i, _get_purpose_name(p))
 
         self._lbl_dim_header.setText(t("panels.dimensions_mm", "Dimensions (mm)"))
         self._lbl_aperture_header.setText(t("panels.aperture_mm", "Aperture (mm)"))
 
-        # Aperture labels
-        self._fan_row_label.setText(t("aperture.angle", "Angle:"))
-        self._fan_sw_label.setText(t("aperture.slit_width", "Slit:"))
-        self._pencil_label.setText(t("aperture.diameter", "Diameter:"))
-        self._slit_in_label.setText(t("aperture.entry", "Entry:"))
-        self._slit_out_label.setText(t("aperture.exit", "Exit:"))
+        # Aperture labels (rows built so far)
+        for key, (label, _spin) in self._aperture_rows.items():
+            i18n_key, default, _rng, _sfx = _APERTURE_ROW_SPECS[key]
+            label.setText(t(i18n_key, default))
 
         # Refresh stage combo text (names may include translated parts)
         self._refresh_all()
@@ -354,97 +497,148 @@ class LayerPanel(QWidget):
 
     def _refresh_all(self) -> None:
         """Full refresh of stage combo and properties."""
+        self._mark_dirty(_DIRTY_ALL)
+        self._apply_dirty()
+
+    def _mark_dirty(self, parts: int) -> None:
+        """Schedule a refresh of *parts* (``_DIRTY_*`` bits)."""
+        self._dirty |= parts
+        self._refresh_timer.start()
+
+    def _apply_dirty(self) -> None:
+        """Refresh every section marked dirty since the last pass."""
+        if self._in_refresh:
+            return
+        self._refresh_timer.stop()
+        dirty, self._dirty = self._dirty, 0
+        # Active stage is read once per pass and handed to each section
+        ctrl = self._controller
+        idx = ctrl.active_stage_index
+        stage = ctrl.active_stage
+        self._in_refresh = True
+        try:
+            if dirty & _DIRTY_STAGES:
+                self._refresh_stage_combo(idx)
+                self._update_stage_buttons(idx)
+            if dirty & _DIRTY_PROPS:
+                self._refresh_stage_props(stage)
+            if dirty & _DIRTY_APERTURE:
+                self._refresh_aperture(stage)
+        finally:
+            self._in_refresh = False
+
+    def _refresh_stage_combo(self, active_index: int) -> None:
         geo = self._controller.geometry
-        with QSignalBlocker(self._stage_combo):
-            self._stage_combo.clear()
-            for i, stage in enumerate(geo.stages):
-                label = f"{i}: {stage.name}" if stage.name else f"Stage {i}"
-                self._stage_combo.addItem(label, i)
-            self._stage_combo.setCurrentIndex(self._controller.active_stage_index)
-
-        self._refresh_stage_props()
-        self._update_stage_buttons()
-        self._refresh_aperture()
-
-    def _update_stage_buttons(self) -> None:
-        """Enable/disable stage buttons based on current state."""
-        geo = self._controller.geometry
-        idx = self._controller.active_stage_index
-        count = geo.stage_count
+        # Only touch the combo when the stage list (names/count) changed;
+        # most geometry_changed emissions are numeric property edits
+        sig = tuple(stage.name or "" for stage in geo.stages)
+        combo = self._stage_combo
+        with QSignalBlocker(combo):
+            if sig != self._combo_signature or combo.count() != len(sig):
+                # Update rows in place: rename changed ones, append or
+                # trim the tail, instead of clearing and refilling
+                count = combo.count()
+                for i, name in enumerate(sig):
+                    label = f"{i}: {name}" if name else f"Stage {i}"
+                    if i >= count:
+                        combo.addItem(label, i)
+                    elif combo.itemText(i) != label:
+                        combo.setItemText(i, label)
+                for i in range(count - 1, len(sig) - 1, -1):
+                    combo.removeItem(i)
+                self._combo_signature = sig
+            combo.setCurrentIndex(active_index)
+
+    def _update_stage_buttons(self, idx: int) -> None:
+        """Enable/disable stage buttons for active stage *idx*."""
+        count = self._controller.geometry.stage_count
 
         self._btn_add_stage.setEnabled(count < MAX_STAGES)
         self._btn_remove_stage.setEnabled(count > MIN_STAGES)
         self._btn_move_up.setEnabled(idx > 0)
         self._btn_move_down.setEnabled(idx < count - 1)
 
-    def _refresh_stage_props(self) -> None:
-        """Refresh stage property widgets from active stage."""
-        stage = self._controller.active_stage
+    def _refresh_stage_props(self, stage: CollimatorStage | None) -> None:
+        """Refresh stage property widgets from the active *stage*."""
         if not stage:
             return
 
-        with QSignalBlocker(self._edit_name):
-            self._edit_name.setText(stage.name)
-        with QSignalBlocker(self._combo_purpose):
-            for i in range(self._combo_purpose.count()):
-                if self._combo_purpose.itemData(i) == stage.purpose:
-                    self._combo_purpose.setCurrentIndex(i)
-                    break
-        with QSignalBlocker(self._spin_width):
-            self._spin_width.setValue(stage.outer_width)
-        with QSignalBlocker(self._spin_height):
-            self._spin_height.setValue(stage.outer_height)
-        with QSignalBlocker(self._spin_x_offset):
-            self._spin_x_offset.setValue(stage.x_offset)
-        with QSignalBlocker(self._spin_y_position):
-            self._spin_y_position.setValue(stage.y_position)
-        with QSignalBlocker(self._combo_material):
-            idx = MATERIAL_IDS.index(stage.material_id) if stage.material_id in MATERIAL_IDS else 0
-            self._combo_material.setCurrentIndex(idx)
+        # Each widget is written only if it shows something else: setText()
+        # would also reset the cursor and undo history of the name field
+        with MultiBlocker(self._prop_widgets):
+            if self._edit_name.text() != stage.name:
+                self._edit_name.setText(stage.name)
+            _set_combo_index(self._combo_purpose, _PURPOSE_INDEX[stage.purpose])
+            _set_spin_value(self._spin_width, stage.outer_width)
+            _set_spin_value(self._spin_height, stage.outer_height)
+            _set_spin_value(self._spin_x_offset, stage.x_offset)
+            _set_spin_value(self._spin_y_position, stage.y_position)
+            _set_combo_index(
+                self._combo_material, MATERIAL_INDEX.get(stage.material_id, 0),
+            )
         self._update_material_swatch(stage.material_id)
 
     def _update_material_swatch(self, material_id: str) -> None:
-        """Update material color swatch."""
-        color_hex = MATERIAL_COLORS.get(material_id, "#64748B")
-        self._mat_swatch.setStyleSheet(
-            f"background: {color_hex}; border-radius: 2px;"
+        """Update material color swatch (skipped if the material is unchanged)."""
+        if material_id == self._last_swatch_id:
+            return
+        self._last_swatch_id = material_id
+        self._mat_swatch.setPixmap(
+            _swatch_pixmap(material_id, self._mat_swatch.devicePixelRatioF())
         )
 
     # ------------------------------------------------------------------
     # Slots from controller
     # ------------------------------------------------------------------
 
+    def _on_geometry_changed(self) -> None:
+        self._mark_dirty(_DIRTY_ALL)
+
     def _on_stage_changed(self, index: int) -> None:
-        if index == self._controller.active_stage_index:
-            self._refresh_stage_props()
+        # Props and aperture only show the active stage
+        if index != self._controller.active_stage_index:
+            return
+        # Echo of our own flush: the widgets already show these values, and
+        # re-setting them would reformat a spinbox the user is typing into
+        if self._suppress_self_refresh:
+            self._mark_dirty(_DIRTY_APERTURE)
+        else:
+            self._mark_dirty(_DIRTY_PROPS | _DIRTY_APERTURE)
+
+    def _on_stage_list_changed(self, _index: int) -> None:
+        self._mark_dirty(_DIRTY_ALL)
+
+    def _on_collimator_type_changed(self, _ctype: CollimatorType) -> None:
+        self._mark_dirty(_DIRTY_APERTURE)
 
     def _on_stage_selected(self, index: int) -> None:
-        with QSignalBlocker(self._stage_combo):
-            self._stage_combo.setCurrentIndex(index)
-        self._refresh_stage_props()
-        self._update_stage_buttons()
-        self._refresh_aperture()
+        self._mark_dirty(_DIRTY_ALL)
 
     # ------------------------------------------------------------------
     # Slots from widgets
     # ------------------------------------------------------------------
 
     def _on_stage_combo_changed(self, index: int) -> None:
+        self._flush_pending_edits()
         if index >= 0:
             self._controller.select_stage(index)
 
     def _on_add_stage(self) -> None:
+        self._flush_pending_edits()
         self._controller.add_stage(after_index=self._controller.active_stage_index)
 
     def _on_remove_stage(self) -> None:
+        self._flush_pending_edits()
         self._controller.remove_stage(self._controller.active_stage_index)
 
     def _on_move_up(self) -> None:
+        self._flush_pending_edits()
         idx = self._controller.active_stage_index
         if idx > 0:
             self._controller.move_stage(idx, idx - 1)
 
     def _on_move_down(self) -> None:
+        self._flush_pending_edits()
         idx = self._controller.active_stage_index
         if idx < self._controller.geometry.stage_count - 1:
             self._controller.move_stage(idx, idx + 1)
@@ -462,24 +656,57 @@ class LayerPanel(QWidget):
             )
 
     def _on_width_changed(self, value: float) -> None:
-        self._controller.set_stage_dimensions(
-            self._controller.active_stage_index, width=value,
-        )
+        self._queue_edit(width=value)
 
     def _on_height_changed(self, value: float) -> None:
-        self._controller.set_stage_dimensions(
-            self._controller.active_stage_index, height=value,
-        )
+        self._queue_edit(height=value)
 
     def _on_x_offset_changed(self, value: float) -> None:
-        self._controller.set_stage_x_offset(
-            self._controller.active_stage_index, value,
-        )
+        self._queue_edit(x=value)
 
     def _on_y_position_changed(self, value: float) -> None:
-        self._controller.set_stage_y_position(
-            self._controller.active_stage_index, value,
-        )
+        self._queue_edit(y=value)
+
+    def _queue_edit(
+        self, aperture: ApertureConfig | None = None, **dims: float,
+    ) -> None:
+        """Record a pending edit for the active stage and (re)start the flush timer."""
+        idx = self._controller.active_stage_index
+        if idx != self._pending_stage:
+            self._flush_pending_edits()
+            self._pending_stage = idx
+        self._pending_dims.update(dims)
+        if aperture is not None:
+            self._pending_aperture = aperture
+        self._flush_timer.start()
+
+    def _flush_pending_edits(self) -> None:
+        """Apply queued spinbox edits to the controller (last value wins)."""
+        self._flush_timer.stop()
+        idx = self._pending_stage
+        dims, self._pending_dims = self._pending_dims, {}
+        aperture, self._pending_aperture = self._pending_aperture, None
+        if idx < 0:
+            return
+
+        ctrl = self._controller
+        self._suppress_self_refresh = True
+        try:
+            if "width" in dims or "height" in dims:
+                ctrl.set_stage_dimensions(
+                    idx, width=dims.get("width"), height=dims.get("height"),
+                )
+            if "x" in dims:
+                ctrl.set_stage_x_offset(idx, dims["x"])
+            if "y" in dims:
+                ctrl.set_stage_y_position(idx, dims["y"])
+        finally:
+            self._suppress_self_refresh = False
+        if aperture is not None:
+            # Force a resync: the stored aperture may be a clamped version
+            # of what was typed (e.g. slit entry < exit)
+            self._aperture_signature = ()
+            ctrl.set_stage_aperture(idx, aperture)
 
     def _on_material_changed(self, idx: int) -> None:
         mat_id = self._combo_material.currentData()
@@ -495,110 +722,113 @@ class LayerPanel(QWidget):
             stage = self._controller.active_stage
             if stage:
                 with QSignalBlocker(self._spin_x_offset):
-                    self._spin_x_offset.setValue(stage.x_offset)
+                    _set_spin_value(self._spin_x_offset, stage.x_offset)
                 with QSignalBlocker(self._spin_y_position):
-                    self._spin_y_position.setValue(stage.y_position)
+                    _set_spin_value(self._spin_y_position, stage.y_position)
 
     # ------------------------------------------------------------------
     # Aperture
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _set_row_visible(
-        label: QLabel, spin: SmartDoubleSpinBox, visible: bool,
-    ) -> None:
-        label.setVisible(visible)
-        spin.setVisible(visible)
-
-    def _refresh_aperture(self) -> None:
-        """Show/hide aperture fields based on collimator type."""
+    def _show_aperture_rows(self, keys: tuple[str, ...]) -> None:
+        """Show the aperture rows in *keys* (building them if needed), hide the rest."""
+        for key in keys:
+            self._aperture_row(key)
+        for key, (label, spin) in self._aperture_rows.items():
+            visible = key in keys
+            if spin.isHidden() == visible:
+                label.setVisible(visible)
+                spin.setVisible(visible)
+
+    def _refresh_aperture(self, stage: CollimatorStage | None) -> None:
+        """Show/hide aperture fields for *stage* based on collimator type."""
         ctype = self._controller.geometry.type
-        stage = self._controller.active_stage
 
-        # Hide all
-        self._set_row_visible(self._fan_row_label, self._spin_fan_angle, False)
-        self._set_row_visible(self._fan_sw_label, self._spin_fan_slit, False)
-        self._set_row_visible(self._pencil_label, self._spin_pencil_d, False)
-        self._set_row_visible(self._slit_in_label, self._spin_slit_in, False)
-        self._set_row_visible(self._slit_out_label, self._spin_slit_out, False)
+        # Drags and unrelated edits also emit stage_changed; skip the
+        # hide/show + setValue pass when nothing aperture-related changed
+        if stage:
+            ap = stage.aperture
+            sig = (
+                ctype, id(stage), stage.outer_height,
+                ap.fan_angle, ap.fan_slit_width, ap.pencil_diameter,
+                ap.slit_width, ap.taper_angle,
+            )
+        else:
+            sig = (ctype, None)
+        if sig == self._aperture_signature:
+            return
+        self._aperture_signature = sig
 
-        if not stage:
+        refresh = self._aperture_refreshers.get(ctype) if stage else None
+        if refresh is None:
+            self._show_aperture_rows(())
             return
+        refresh(stage)
 
+    def _refresh_fan_aperture(self, stage: CollimatorStage) -> None:
         ap = stage.aperture
-
-        match ctype:
-            case CollimatorType.FAN_BEAM:
-                self._set_row_visible(
-                    self._fan_row_label, self._spin_fan_angle, True,
-                )
-                self._set_row_visible(
-                    self._fan_sw_label, self._spin_fan_slit, True,
-                )
-                with QSignalBlocker(self._spin_fan_angle):
-                    self._spin_fan_angle.setValue(ap.fan_angle or 30)
-                with QSignalBlocker(self._spin_fan_slit):
-                    self._spin_fan_slit.setValue(ap.fan_slit_width or 2)
-
-            case CollimatorType.PENCIL_BEAM:
-                self._set_row_visible(
-                    self._pencil_label, self._spin_pencil_d, True,
-                )
-                with QSignalBlocker(self._spin_pencil_d):
-                    self._spin_pencil_d.setValue(ap.pencil_diameter or 5)
-
-            case CollimatorType.SLIT:
-                self._set_row_visible(
-                    self._slit_in_label, self._spin_slit_in, True,
-                )
-                self._set_row_visible(
-                    self._slit_out_label, self._spin_slit_out, True,
-                )
-                output_w = ap.slit_width or 2.0
-                if ap.taper_angle and ap.taper_angle > 0 and stage:
-                    input_w = output_w + 2.0 * stage.outer_height * math.tan(
-                        math.radians(ap.taper_angle)
-                    )
-                else:
-                    input_w = output_w
-                with QSignalBlocker(self._spin_slit_in):
-                    self._spin_slit_in.setValue(input_w)
-                with QSignalBlocker(self._spin_slit_out):
-                    self._spin_slit_out.setValue(output_w)
+        self._show_aperture_rows(("fan_angle", "fan_slit"))
+        spin_angle = self._aperture_row("fan_angle")
+        spin_slit = self._aperture_row("fan_slit")
+        with QSignalBlocker(spin_angle):
+            _set_spin_value(spin_angle, ap.fan_angle or 30)
+        with QSignalBlocker(spin_slit):
+            _set_spin_value(spin_slit, ap.fan_slit_width or 2)
+
+    def _refresh_pencil_aperture(self, stage: CollimatorStage) -> None:
+        self._show_aperture_rows(("pencil_d",))
+        spin_d = self._aperture_row("pencil_d")
+        with QSignalBlocker(spin_d):
+            _set_spin_value(spin_d, stage.aperture.pencil_diameter or 5)
+
+    def _refresh_slit_aperture(self, stage: CollimatorStage) -> None:
+        ap = stage.aperture
+        self._show_aperture_rows(("slit_in", "slit_out"))
+        output_w = ap.slit_width or 2.0
+        if ap.taper_angle and ap.taper_angle > 0:
+            input_w = output_w + 2.0 * stage.outer_height * _tan_deg(
+                ap.taper_angle
+            )
+        else:
+            input_w = output_w
+        spin_in = self._aperture_row("slit_in")
+        spin_out = self._aperture_row("slit_out")
+        with QSignalBlocker(spin_in):
+            _set_spin_value(spin_in, input_w)
+        with QSignalBlocker(spin_out):
+            _set_spin_value(spin_out, output_w)
 
     def _on_aperture_changed(self) -> None:
         """Aperture spinbox changed — build new ApertureConfig."""
-        ctype = self._controller.geometry.type
-        stage_idx = self._controller.active_stage_index
+        build = self._aperture_builders.get(self._controller.geometry.type)
+        if build is not None:
+            self._queue_edit(aperture=build())
+
+    def _build_fan_aperture(self) -> ApertureConfig:
+        return ApertureConfig(
+            fan_angle=self._aperture_row("fan_angle").value(),
+            fan_slit_width=self._aperture_row("fan_slit").value(),
+        )
 
-        match ctype:
-            case CollimatorType.FAN_BEAM:
-                ap = ApertureConfig(
-                    fan_angle=self._spin_fan_angle.value(),
-                    fan_slit_width=self._spin_fan_slit.value(),
-                )
-            case CollimatorType.PENCIL_BEAM:
-                ap = ApertureConfig(
-                    pencil_diameter=self._spin_pencil_d.value(),
-                )
-            case CollimatorType.SLIT:
-                input_w = self._spin_slit_in.value()
-                output_w = self._spin_slit_out.value()
-                if input_w < output_w:
-                    input_w = output_w
-                stage = self._controller.active_stage
-                stage_h = stage.outer_height if stage else 50.0
-                if input_w > output_w and stage_h > 0:
-                    taper = math.degrees(math.atan(
-                        (input_w - output_w) / (2.0 * stage_h)
-                    ))
-                else:
-                    taper = 0.0
-                ap = ApertureConfig(
-                    slit_width=output_w,
-                    taper_angle=taper,
-                )
-            case _:
-                return
+    def _build_pencil_aperture(self) -> ApertureConfig:
+        return ApertureConfig(
+            pencil_diameter=self._aperture_row("pencil_d").value(),
+        )
 
-        self._controller.set_stage_aperture(stage_idx, ap)
+    def _build_slit_aperture(self) -> ApertureConfig:
+        input_w = self._aperture_row("slit_in").value()
+        output_w = self._aperture_row("slit_out").value()
+        if input_w < output_w:
+            input_w = output_w
+        stage = self._controller.active_stage
+        stage_h = stage.outer_height if stage else 50.0
+        if input_w > output_w and stage_h > 0:
+            taper = math.degrees(math.atan(
+                (input_w - output_w) / (2.0 * stage_h)
+            ))
+        else:
+            taper = 0.0
+        return ApertureConfig(
+            slit_width=output_w,
+            taper_angle=taper,
+        )
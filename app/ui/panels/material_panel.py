@@ -8,10 +8,10 @@ Reference: Phase-03 spec — Sol Panel, Malzeme Listesi.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QScrollArea, QFrame, QSizePolicy,
+    QScrollArea, QFrame,
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QMimeData
-from PyQt6.QtGui import QColor, QDrag
+from PyQt6.QtGui import QDrag, QPixmap
 
 from app.constants import MATERIAL_IDS, MATERIAL_MIME_TYPE
 from app.core.i18n import t, TranslationManager
@@ -30,6 +30,27 @@ _MATERIAL_INFO: dict[str, tuple[str, str, float, float]] = {
     "Bronze": ("Bronze", "CuSn", 29, 8.8),
 }
 
+# Card stylesheets, built once and shared by every card
+_CARD_QSS = """
+    MaterialCard {
+        background: #1E293B;
+        border: 1px solid #334155;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    MaterialCard:hover {
+        border: 1px solid #3B82F6;
+    }
+"""
+_SWATCH_QSS_FMT = "background: {}; border-radius: 2px; border: 1px solid #475569;"
+_SWATCH_QSS: dict[str, str] = {
+    mid: _SWATCH_QSS_FMT.format(MATERIAL_COLORS.get(mid, "#64748B"))
+    for mid in MATERIAL_IDS
+}
+_SWATCH_QSS_DEFAULT = _SWATCH_QSS_FMT.format("#64748B")
+_NAME_QSS = "color: #F8FAFC; font-size: 8pt;"
+_DETAIL_QSS = "color: #94A3B8; font-size: 8pt; padding-left: 24px;"
+
 
 class MaterialCard(QFrame):
     """Single material card with color swatch, name, Z, density."""
@@ -41,22 +62,14 @@ class MaterialCard(QFrame):
         self._material_id = material_id
         self._expanded = False
         self._drag_start = None
+        # Drag preview, grabbed on the first drag and reused until the
+        # card's size or text changes
+        self._drag_pixmap: QPixmap | None = None
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setStyleSheet("""
-            MaterialCard {
-                background: #1E293B;
-                border: 1px solid #334155;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            MaterialCard:hover {
-                border: 1px solid #3B82F6;
-            }
-        """)
+        self.setStyleSheet(_CARD_QSS)
 
         info = _MATERIAL_INFO.get(material_id, ("?", "?", 0, 0))
-        color_hex = MATERIAL_COLORS.get(material_id, "#64748B")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 6, 8, 6)
@@ -68,21 +81,19 @@ class MaterialCard(QFrame):
 
         swatch = QLabel()
         swatch.setFixedSize(16, 16)
-        swatch.setStyleSheet(
-            f"background: {color_hex}; border-radius: 2px; border: 1px solid #475569;"
-        )
+        swatch.setStyleSheet(_SWATCH_QSS.get(material_id, _SWATCH_QSS_DEFAULT))
         top.addWidget(swatch)
 
         mat_name = t(f"materials.{material_id}", info[0])
         self._name_label = QLabel(f"<b>{material_id}</b> — {mat_name}")
-        self._name_label.setStyleSheet("color: #F8FAFC; font-size: 8pt;")
+        self._name_label.setStyleSheet(_NAME_QSS)
         top.addWidget(self._name_label, 1)
 
         layout.addLayout(top)
 
         # Detail row (always visible, compact)
         detail = QLabel(f"Z={info[2]}  |  \u03C1={info[3]:.2f} g/cm\u00B3")
-        detail.setStyleSheet("color: #94A3B8; font-size: 8pt; padding-left: 24px;")
+        detail.setStyleSheet(_DETAIL_QSS)
         layout.addWidget(detail)
 
     def retranslate_ui(self) -> None:
@@ -90,6 +101,11 @@ class MaterialCard(QFrame):
         info = _MATERIAL_INFO.get(self._material_id, ("?", "?", 0, 0))
         mat_name = t(f"materials.{self._material_id}", info[0])
         self._name_label.setText(f"<b>{self._material_id}</b> — {mat_name}")
+        self._drag_pixmap = None
+
+    def resizeEvent(self, event):
+        self._drag_pixmap = None
+        super().resizeEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -108,8 +124,13 @@ class MaterialCard(QFrame):
         mime = QMimeData()
         mime.setData(MATERIAL_MIME_TYPE, self._material_id.encode())
         drag.setMimeData(mime)
-        pixmap = self.grab()
-        drag.setPixmap(pixmap.scaledToWidth(min(pixmap.width(), 150)))
+        if self._drag_pixmap is None:
+            pixmap = self.grab()
+            # Transient preview: nearest-neighbour scaling is good enough
+            self._drag_pixmap = pixmap.scaledToWidth(
+                min(pixmap.width(), 150), Qt.TransformationMode.FastTransformation,
+            )
+        drag.setPixmap(self._drag_pixmap)
         drag.setHotSpot(event.pos())
         drag.exec(Qt.DropAction.CopyAction)
 
@@ -8,14 +8,15 @@ Reference: Phase-03.5 spec — Phantom Panel.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QSpinBox, QComboBox, QCheckBox, QFrame, QListWidget,
+    QSpinBox, QCheckBox, QFrame, QListWidget,
     QListWidgetItem, QPushButton,
 )
 
+from app.ui.widgets.material_combo import MATERIAL_INDEX, make_material_combo
+from app.ui.widgets.signal_blockers import MultiBlocker
 from app.ui.widgets.smart_spinbox import SmartDoubleSpinBox
-from PyQt6.QtCore import QSignalBlocker, Qt
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 
-from app.constants import MATERIAL_IDS
 from app.core.i18n import t, TranslationManager
 from app.models.phantom import (
     GridPhantom,
@@ -26,6 +27,37 @@ from app.models.phantom import (
 from app.ui.canvas.geometry_controller import GeometryController
 
 
+# Panel sections a deferred refresh has to update (bit mask)
+_DIRTY_LIST = 0x1
+_DIRTY_PROPS = 0x2
+_DIRTY_ALL = _DIRTY_LIST | _DIRTY_PROPS
+
+# Spin box rows: key -> (i18n key, default label, (min, max), decimals, step, suffix)
+_SPIN_ROW_SPECS: dict[str, tuple[str, str, tuple[float, float], int, float, str]] = {
+    "y": ("phantom.y_position_mm", "Y Pos (mm):", (0, 5000), 2, 1.0, ""),
+    "wire_d": ("phantom.diameter_mm", "Dia (mm):", (0.01, 10.0), 2, 0.1, ""),
+    "lp_freq": ("phantom.frequency", "Frequency:", (0.1, 20.0), 2, 0.1, " lp/mm"),
+    "lp_thick": ("phantom.thickness_mm", "Thick (mm):", (0.1, 10.0), 2, 0.1, ""),
+    "grid_pitch": ("phantom.pitch_mm", "Pitch (mm):", (0.1, 50.0), 2, 0.5, ""),
+    "grid_wd": ("phantom.wire_dia_mm", "Wire (mm):", (0.01, 5.0), 2, 0.1, ""),
+}
+
+
+def _phantom_signature(phantom) -> tuple:
+    """Every phantom value shown by the property editors, as a tuple."""
+    if phantom is None:
+        return (None,)
+    cfg = phantom.config
+    sig = (type(phantom), id(phantom), cfg.position_y, cfg.material_id, cfg.enabled)
+    if isinstance(phantom, WirePhantom):
+        return sig + (phantom.diameter,)
+    if isinstance(phantom, LinePairPhantom):
+        return sig + (phantom.frequency, phantom.bar_thickness, phantom.num_cycles)
+    if isinstance(phantom, GridPhantom):
+        return sig + (phantom.pitch, phantom.wire_diameter)
+    return sig
+
+
 class PhantomPanel(QWidget):
     """Panel for managing test objects (phantoms).
 
@@ -39,6 +71,17 @@ class PhantomPanel(QWidget):
     ):
         super().__init__(parent)
         self._controller = controller
+
+        # Controller signals only mark sections dirty; a zero-delay timer
+        # refreshes them once, so e.g. phantom_changed + geometry_changed
+        # from one edit cost a single pass
+        self._dirty = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._apply_dirty)
+        # Values last written to the property editors (see _refresh_properties)
+        self._props_signature: tuple = ()
         self._build_ui()
         self._connect_signals()
         self._refresh_all()
@@ -84,24 +127,14 @@ class PhantomPanel(QWidget):
         common_layout.setSpacing(3)
 
         # Y Position
-        row_y = QHBoxLayout()
-        self._lbl_y_position = self._prop_label(t("phantom.y_position_mm", "Y Pos (mm):"))
-        row_y.addWidget(self._lbl_y_position)
-        self._spin_y = SmartDoubleSpinBox()
-        self._spin_y.setRange(0, 5000)
-        self._spin_y.setDecimals(2)
-        self._spin_y.setSingleStep(1.0)
-        row_y.addWidget(self._spin_y)
-        common_layout.addLayout(row_y)
+        self._lbl_y_position, self._spin_y = self._add_spin_row(common_layout, "y")
 
         # Material
         row_mat = QHBoxLayout()
         self._lbl_material = self._prop_label(t("phantom.material", "Material:"))
         row_mat.addWidget(self._lbl_material)
-        self._combo_material = QComboBox()
+        self._combo_material = make_material_combo()
         self._combo_material.setProperty("cssClass", "small-combo")
-        for mid in MATERIAL_IDS:
-            self._combo_material.addItem(mid, mid)
         row_mat.addWidget(self._combo_material)
         common_layout.addLayout(row_mat)
 
@@ -117,50 +150,53 @@ class PhantomPanel(QWidget):
 
         layout.addWidget(common_frame)
 
-        # --- Wire properties ---
-        self._wire_frame = self._make_frame()
-        wire_layout = QVBoxLayout(self._wire_frame)
-        wire_layout.setContentsMargins(6, 4, 6, 4)
-        wire_layout.setSpacing(3)
-
-        row_wd = QHBoxLayout()
-        self._lbl_wire_diameter = self._prop_label(t("phantom.diameter_mm", "Dia (mm):"))
-        row_wd.addWidget(self._lbl_wire_diameter)
-        self._spin_wire_d = SmartDoubleSpinBox()
-        self._spin_wire_d.setRange(0.01, 10.0)
-        self._spin_wire_d.setDecimals(2)
-        self._spin_wire_d.setSingleStep(0.1)
-        row_wd.addWidget(self._spin_wire_d)
-        wire_layout.addLayout(row_wd)
-
-        layout.addWidget(self._wire_frame)
-
-        # --- Line-pair properties ---
-        self._lp_frame = self._make_frame()
-        lp_layout = QVBoxLayout(self._lp_frame)
-        lp_layout.setContentsMargins(6, 4, 6, 4)
-        lp_layout.setSpacing(3)
-
-        row_freq = QHBoxLayout()
-        self._lbl_frequency = self._prop_label(t("phantom.frequency", "Frequency:"))
-        row_freq.addWidget(self._lbl_frequency)
-        self._spin_lp_freq = SmartDoubleSpinBox()
-        self._spin_lp_freq.setRange(0.1, 20.0)
-        self._spin_lp_freq.setSuffix(" lp/mm")
-        self._spin_lp_freq.setDecimals(2)
-        self._spin_lp_freq.setSingleStep(0.1)
-        row_freq.addWidget(self._spin_lp_freq)
-        lp_layout.addLayout(row_freq)
-
-        row_bt = QHBoxLayout()
-        self._lbl_thickness = self._prop_label(t("phantom.thickness_mm", "Thick (mm):"))
-        row_bt.addWidget(self._lbl_thickness)
-        self._spin_lp_thick = SmartDoubleSpinBox()
-        self._spin_lp_thick.setRange(0.1, 10.0)
-        self._spin_lp_thick.setDecimals(2)
-        self._spin_lp_thick.setSingleStep(0.1)
-        row_bt.addWidget(self._spin_lp_thick)
-        lp_layout.addLayout(row_bt)
+        # Type-specific frames are built on first use (see _type_frame)
+        layout.addStretch()
+        self._layout = layout
+        self._type_frames: dict[type, QFrame] = {}
+        self._type_frame_builders = {
+            WirePhantom: self._build_wire_frame,
+            LinePairPhantom: self._build_lp_frame,
+            GridPhantom: self._build_grid_frame,
+        }
+
+        # Editors written together by _refresh_properties; the type frame
+        # builders append their own
+        self._prop_widgets: tuple[QWidget, ...] = (
+            self._spin_y, self._combo_material, self._chk_enabled,
+        )
+
+    def _type_frame(self, phantom) -> QFrame | None:
+        """Return the property frame for *phantom*'s type, building it on first use."""
+        ptype = type(phantom)
+        frame = self._type_frames.get(ptype)
+        if frame is None:
+            build = self._type_frame_builders.get(ptype)
+            if build is None:
+                return None
+            frame = self._make_frame()
+            frame_layout = QVBoxLayout(frame)
+            frame_layout.setContentsMargins(6, 4, 6, 4)
+            frame_layout.setSpacing(3)
+            build(frame_layout)
+            frame.hide()
+            # Above the trailing stretch
+            self._layout.insertWidget(self._layout.count() - 1, frame)
+            self._type_frames[ptype] = frame
+        return frame
+
+    def _build_wire_frame(self, wire_layout: QVBoxLayout) -> None:
+        self._lbl_wire_diameter, self._spin_wire_d = self._add_spin_row(
+            wire_layout, "wire_d")
+
+        self._spin_wire_d.valueChanged.connect(self._on_wire_d_changed)
+        self._prop_widgets += (self._spin_wire_d,)
+
+    def _build_lp_frame(self, lp_layout: QVBoxLayout) -> None:
+        self._lbl_frequency, self._spin_lp_freq = self._add_spin_row(
+            lp_layout, "lp_freq")
+        self._lbl_thickness, self._spin_lp_thick = self._add_spin_row(
+            lp_layout, "lp_thick")
 
         row_nc = QHBoxLayout()
         self._lbl_cycles = self._prop_label(t("phantom.cycles", "Cycles:"))
@@ -170,37 +206,40 @@ class PhantomPanel(QWidget):
         row_nc.addWidget(self._spin_lp_cycles)
         lp_layout.addLayout(row_nc)
 
-        layout.addWidget(self._lp_frame)
-
-        # --- Grid properties ---
-        self._grid_frame = self._make_frame()
-        grid_layout = QVBoxLayout(self._grid_frame)
-        grid_layout.setContentsMargins(6, 4, 6, 4)
-        grid_layout.setSpacing(3)
-
-        row_pitch = QHBoxLayout()
-        self._lbl_pitch = self._prop_label(t("phantom.pitch_mm", "Pitch (mm):"))
-        row_pitch.addWidget(self._lbl_pitch)
-        self._spin_grid_pitch = SmartDoubleSpinBox()
-        self._spin_grid_pitch.setRange(0.1, 50.0)
-        self._spin_grid_pitch.setDecimals(2)
-        self._spin_grid_pitch.setSingleStep(0.5)
-        row_pitch.addWidget(self._spin_grid_pitch)
-        grid_layout.addLayout(row_pitch)
-
-        row_gw = QHBoxLayout()
-        self._lbl_grid_wire_d = self._prop_label(t("phantom.wire_dia_mm", "Wire (mm):"))
-        row_gw.addWidget(self._lbl_grid_wire_d)
-        self._spin_grid_wd = SmartDoubleSpinBox()
-        self._spin_grid_wd.setRange(0.01, 5.0)
-        self._spin_grid_wd.setDecimals(2)
-        self._spin_grid_wd.setSingleStep(0.1)
-        row_gw.addWidget(self._spin_grid_wd)
-        grid_layout.addLayout(row_gw)
-
-        layout.addWidget(self._grid_frame)
+        self._spin_lp_freq.valueChanged.connect(self._on_lp_freq_changed)
+        self._spin_lp_thick.valueChanged.connect(self._on_lp_thick_changed)
+        self._spin_lp_cycles.valueChanged.connect(self._on_lp_cycles_changed)
+        self._prop_widgets += (
+            self._spin_lp_freq, self._spin_lp_thick, self._spin_lp_cycles,
+        )
 
-        layout.addStretch()
+    def _build_grid_frame(self, grid_layout: QVBoxLayout) -> None:
+        self._lbl_pitch, self._spin_grid_pitch = self._add_spin_row(
+            grid_layout, "grid_pitch")
+        self._lbl_grid_wire_d, self._spin_grid_wd = self._add_spin_row(
+            grid_layout, "grid_wd")
+
+        self._spin_grid_pitch.valueChanged.connect(self._on_grid_pitch_changed)
+        self._spin_grid_wd.valueChanged.connect(self._on_grid_wd_changed)
+        self._prop_widgets += (self._spin_grid_pitch, self._spin_grid_wd)
+
+    def _add_spin_row(
+        self, layout: QVBoxLayout, key: str,
+    ) -> tuple[QLabel, SmartDoubleSpinBox]:
+        """Add a label + spin box row built from ``_SPIN_ROW_SPECS[key]``."""
+        i18n_key, default, rng, decimals, step, suffix = _SPIN_ROW_SPECS[key]
+        row = QHBoxLayout()
+        label = self._prop_label(t(i18n_key, default))
+        row.addWidget(label)
+        spin = SmartDoubleSpinBox()
+        spin.setRange(*rng)
+        spin.setDecimals(decimals)
+        spin.setSingleStep(step)
+        if suffix:
+            spin.setSuffix(suffix)
+        row.addWidget(spin)
+        layout.addLayout(row)
+        return label, spin
 
     def _prop_label(self, text: str) -> QLabel:
         lbl = QLabel(text)
@@ -216,12 +255,14 @@ class PhantomPanel(QWidget):
     def _connect_signals(self) -> None:
         ctrl = self._controller
 
-        # Controller -> panel
-        ctrl.phantom_added.connect(self._refresh_all)
-        ctrl.phantom_removed.connect(self._refresh_all)
-        ctrl.phantom_changed.connect(self._on_phantom_changed)
-        ctrl.phantom_selected.connect(self._on_phantom_selected)
-        ctrl.geometry_changed.connect(self._refresh_all)
+        # Controller -> panel (controller lives in the GUI thread; the slots
+        # only mark sections dirty, so call them directly)
+        direct = Qt.ConnectionType.DirectConnection
+        ctrl.phantom_added.connect(self._on_phantom_list_changed, direct)
+        ctrl.phantom_removed.connect(self._on_phantom_list_changed, direct)
+        ctrl.phantom_changed.connect(self._on_phantom_changed, direct)
+        ctrl.phantom_selected.connect(self._on_phantom_selected, direct)
+        ctrl.geometry_changed.connect(self._on_phantom_list_changed, direct)
 
         # Button clicks
         self._btn_add_wire.clicked.connect(
@@ -239,18 +280,7 @@ class PhantomPanel(QWidget):
         self._spin_y.valueChanged.connect(self._on_y_changed)
         self._combo_material.currentIndexChanged.connect(self._on_material_changed)
         self._chk_enabled.toggled.connect(self._on_enabled_changed)
-
-        # Wire
-        self._spin_wire_d.valueChanged.connect(self._on_wire_d_changed)
-
-        # Line-pair
-        self._spin_lp_freq.valueChanged.connect(self._on_lp_freq_changed)
-        self._spin_lp_thick.valueChanged.connect(self._on_lp_thick_changed)
-        self._spin_lp_cycles.valueChanged.connect(self._on_lp_cycles_changed)
-
-        # Grid
-        self._spin_grid_pitch.valueChanged.connect(self._on_grid_pitch_changed)
-        self._spin_grid_wd.valueChanged.connect(self._on_grid_wd_changed)
+        # Type-specific editors are connected by their frame builders
 
     # ------------------------------------------------------------------
     # Retranslation
@@ -268,96 +298,132 @@ class PhantomPanel(QWidget):
         self._lbl_material.setText(t("phantom.material", "Material:"))
         self._lbl_enabled.setText(t("phantom.enabled", "Enabled:"))
 
-        # Wire
-        self._lbl_wire_diameter.setText(t("phantom.diameter_mm", "Dia (mm):"))
+        # Type-specific labels (frames not built yet pick up the current
+        # language when they are)
+        if WirePhantom in self._type_frames:
+            self._lbl_wire_diameter.setText(t("phantom.diameter_mm", "Dia (mm):"))
 
-        # Line-pair
-        self._lbl_frequency.setText(t("phantom.frequency", "Frequency:"))
-        self._lbl_thickness.setText(t("phantom.thickness_mm", "Thick (mm):"))
-        self._lbl_cycles.setText(t("phantom.cycles", "Cycles:"))
+        if LinePairPhantom in self._type_frames:
+            self._lbl_frequency.setText(t("phantom.frequency", "Frequency:"))
+            self._lbl_thickness.setText(t("phantom.thickness_mm", "Thick (mm):"))
+            self._lbl_cycles.setText(t("phantom.cycles", "Cycles:"))
 
-        # Grid
-        self._lbl_pitch.setText(t("phantom.pitch_mm", "Pitch (mm):"))
-        self._lbl_grid_wire_d.setText(t("phantom.wire_dia_mm", "Wire (mm):"))
+        if GridPhantom in self._type_frames:
+            self._lbl_pitch.setText(t("phantom.pitch_mm", "Pitch (mm):"))
+            self._lbl_grid_wire_d.setText(t("phantom.wire_dia_mm", "Wire (mm):"))
 
     # ------------------------------------------------------------------
     # Refresh
     # ------------------------------------------------------------------
 
-    def _refresh_all(self, *_args) -> None:
-        """Rebuild the phantom list and refresh properties."""
-        with QSignalBlocker(self._list):
-            self._list.clear()
-            for phantom in self._controller.geometry.phantoms:
-                item = QListWidgetItem(phantom.config.name)
-                self._list.addItem(item)
+    def _refresh_all(self) -> None:
+        """Refresh the phantom list and properties now."""
+        self._mark_dirty(_DIRTY_ALL)
+        self._apply_dirty()
+
+    def _mark_dirty(self, parts: int) -> None:
+        """Schedule a refresh of *parts* (``_DIRTY_*`` bits)."""
+        self._dirty |= parts
+        self._refresh_timer.start()
+
+    def _apply_dirty(self) -> None:
+        """Refresh every section marked dirty since the last pass."""
+        self._refresh_timer.stop()
+        dirty, self._dirty = self._dirty, 0
+        if dirty & _DIRTY_LIST:
+            self._refresh_list()
+        if dirty & _DIRTY_PROPS:
+            self._refresh_properties()
+
+    def _refresh_list(self) -> None:
+        """Sync the phantom list rows and selection with the controller."""
+        phantoms = self._controller.geometry.phantoms
+        lst = self._list
+        with QSignalBlocker(lst):
+            # Update rows in place: rename changed ones, append or trim the
+            # tail, instead of clearing and re-creating every item
+            count = lst.count()
+            for i, phantom in enumerate(phantoms):
+                name = phantom.config.name
+                if i >= count:
+                    lst.addItem(QListWidgetItem(name))
+                else:
+                    item = lst.item(i)
+                    if item.text() != name:
+                        item.setText(name)
+            for i in range(count - 1, len(phantoms) - 1, -1):
+                lst.takeItem(i)
 
             idx = self._controller.active_phantom_index
-            if 0 <= idx < self._list.count():
-                self._list.setCurrentRow(idx)
+            lst.setCurrentRow(idx if 0 <= idx < lst.count() else -1)
 
-        self._refresh_properties()
+    def _on_phantom_list_changed(self, *_args) -> None:
+        self._mark_dirty(_DIRTY_ALL)
 
     def _on_phantom_changed(self, index: int) -> None:
-        phantoms = self._controller.geometry.phantoms
-        if 0 <= index < len(phantoms):
-            name = phantoms[index].config.name
-            item = self._list.item(index)
-            if item:
-                item.setText(name)
+        # The list pass also picks up a renamed phantom
         if index == self._controller.active_phantom_index:
-            self._refresh_properties()
+            self._mark_dirty(_DIRTY_ALL)
+        else:
+            self._mark_dirty(_DIRTY_LIST)
 
-    def _on_phantom_selected(self, index: int) -> None:
-        with QSignalBlocker(self._list):
-            if 0 <= index < self._list.count():
-                self._list.setCurrentRow(index)
-        self._refresh_properties()
+    def _on_phantom_selected(self, _index: int) -> None:
+        self._mark_dirty(_DIRTY_ALL)
 
     def _refresh_properties(self) -> None:
         """Update property editors from active phantom."""
+        # geometry_changed and edits to other phantoms also land here; skip
+        # the pass when nothing the editors show has changed
+        sig = _phantom_signature(self._controller.active_phantom)
+        if sig == self._props_signature:
+            return
+        self._props_signature = sig
+
+        # Frame visibility and editor values change together; hold repaints
+        # so the panel lays out and paints once afterwards
+        self.setUpdatesEnabled(False)
+        try:
+            self._refresh_properties_impl()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_type_frame(self, frame: QFrame | None) -> None:
+        """Show *frame* and hide the other type frames (only if that changes)."""
+        for f in self._type_frames.values():
+            visible = f is frame
+            if f.isHidden() == visible:
+                f.setVisible(visible)
+
+    def _refresh_properties_impl(self) -> None:
         phantom = self._controller.active_phantom
-
-        # Hide all type frames
-        self._wire_frame.setVisible(False)
-        self._lp_frame.setVisible(False)
-        self._grid_frame.setVisible(False)
-
         if phantom is None:
+            self._show_type_frame(None)
             return
 
         cfg = phantom.config
 
-        with QSignalBlocker(self._spin_y):
+        # Build (if needed) before blocking, so new editors are blocked too
+        self._show_type_frame(self._type_frame(phantom))
+
+        with MultiBlocker(self._prop_widgets):
             self._spin_y.setValue(cfg.position_y)
 
-        with QSignalBlocker(self._combo_material):
-            idx = self._combo_material.findData(cfg.material_id)
-            if idx >= 0:
+            idx = MATERIAL_INDEX.get(cfg.material_id)
+            if idx is not None:
                 self._combo_material.setCurrentIndex(idx)
 
-        with QSignalBlocker(self._chk_enabled):
             self._chk_enabled.setChecked(cfg.enabled)
 
-        if isinstance(phantom, WirePhantom):
-            self._wire_frame.setVisible(True)
-            with QSignalBlocker(self._spin_wire_d):
+            if isinstance(phantom, WirePhantom):
                 self._spin_wire_d.setValue(phantom.diameter)
 
-        elif isinstance(phantom, LinePairPhantom):
-            self._lp_frame.setVisible(True)
-            with QSignalBlocker(self._spin_lp_freq):
+            elif isinstance(phantom, LinePairPhantom):
                 self._spin_lp_freq.setValue(phantom.frequency)
-            with QSignalBlocker(self._spin_lp_thick):
                 self._spin_lp_thick.setValue(phantom.bar_thickness)
-            with QSignalBlocker(self._spin_lp_cycles):
                 self._spin_lp_cycles.setValue(phantom.num_cycles)
 
-        elif isinstance(phantom, GridPhantom):
-            self._grid_frame.setVisible(True)
-            with QSignalBlocker(self._spin_grid_pitch):
+            elif isinstance(phantom, GridPhantom):
                 self._spin_grid_pitch.setValue(phantom.pitch)
-            with QSignalBlocker(self._spin_grid_wd):
                 self._spin_grid_wd.setValue(phantom.wire_diameter)
 
     # ------------------------------------------------------------------
@@ -14,7 +14,7 @@ Reference: Phase-03.5 spec — Projection Results.
 from __future__ import annotations
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
+    QWidget, QVBoxLayout, QLabel,
 )
 from PyQt6.QtCore import Qt
 
@@ -19,6 +19,24 @@ from app.models.geometry import FocalSpotDistribution
 from app.ui.canvas.geometry_controller import GeometryController
 
 
+# Panel-wide stylesheet, applied once instead of per widget
+_PANEL_QSS = """
+QComboBox, QComboBox QAbstractItemView { font-size: 8pt; }
+QLabel[cssClass="section-header"] {
+    color: #F8FAFC; font-weight: bold; font-size: 8pt;
+}
+QLabel#sddValue { color: #F8FAFC; font-size: 8pt; }
+"""
+
+# Combo row for each focal-spot distribution / tube output method
+# (combos are filled in this order)
+_FOCAL_DIST_INDEX: dict[FocalSpotDistribution, int] = {
+    FocalSpotDistribution.UNIFORM: 0,
+    FocalSpotDistribution.GAUSSIAN: 1,
+}
+_TUBE_METHOD_INDEX: dict[str, int] = {"empirical": 0, "spectral": 1, "lookup": 2}
+
+
 class PropertiesPanel(QWidget):
     """Right dock panel section — numeric property editors.
 
@@ -34,15 +52,18 @@ class PropertiesPanel(QWidget):
         self._controller = controller
         self._energy_mode = "kVp"
         self._dose_per_pulse = 0.8 / 260.0  # Gy/min per pulse calibration
+        # Fill the widgets before any slot is connected, so the initial
+        # values cannot echo back to the controller
         self._build_ui()
-        self._connect_signals()
         self._refresh_all()
+        self._connect_signals()
         TranslationManager.on_language_changed(self.retranslate_ui)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(6)
+        self.setStyleSheet(_PANEL_QSS)
 
         # --- Source ---
         self._lbl_source_header = self._section_label(t("panels.source_mm", "Source (mm)"))
@@ -66,7 +87,6 @@ class PropertiesPanel(QWidget):
         self._lbl_distribution = self._prop_label(t("panels.distribution", "Distribution:"))
         row2b.addWidget(self._lbl_distribution)
         self._combo_focal_dist = QComboBox()
-        self._combo_focal_dist.setStyleSheet("font-size: 8pt;")
         self._combo_focal_dist.addItem(
             "Uniform", FocalSpotDistribution.UNIFORM
         )
@@ -122,7 +142,6 @@ class PropertiesPanel(QWidget):
         )
         row_method.addWidget(self._lbl_tube_method)
         self._combo_tube_method = QComboBox()
-        self._combo_tube_method.setStyleSheet("font-size: 8pt;")
         self._combo_tube_method.addItem(
             t("panels.empirical", "Empirical"), "empirical"
         )
@@ -206,7 +225,7 @@ class PropertiesPanel(QWidget):
         self._lbl_sdd_label = self._prop_label(t("panels.sdd", "SDD:"))
         row5.addWidget(self._lbl_sdd_label)
         self._lbl_sdd = QLabel("\u2014")
-        self._lbl_sdd.setStyleSheet("color: #F8FAFC; font-size: 8pt;")
+        self._lbl_sdd.setObjectName("sddValue")
         row5.addWidget(self._lbl_sdd)
         det_layout.addLayout(row5)
 
@@ -219,7 +238,7 @@ class PropertiesPanel(QWidget):
 
     def _section_label(self, text: str) -> QLabel:
         lbl = QLabel(text)
-        lbl.setStyleSheet("color: #F8FAFC; font-weight: bold; font-size: 8pt;")
+        lbl.setProperty("cssClass", "section-header")
         return lbl
 
     def _prop_label(self, text: str) -> QLabel:
@@ -315,10 +334,9 @@ class PropertiesPanel(QWidget):
         with QSignalBlocker(self._spin_focal):
             self._spin_focal.setValue(src.focal_spot_size)
         with QSignalBlocker(self._combo_focal_dist):
-            for i in range(self._combo_focal_dist.count()):
-                if self._combo_focal_dist.itemData(i) == src.focal_spot_distribution:
-                    self._combo_focal_dist.setCurrentIndex(i)
-                    break
+            idx = _FOCAL_DIST_INDEX.get(src.focal_spot_distribution)
+            if idx is not None:
+                self._combo_focal_dist.setCurrentIndex(idx)
         with QSignalBlocker(self._spin_beam_angle):
             self._spin_beam_angle.setValue(src.beam_angle)
 
@@ -326,8 +344,8 @@ class PropertiesPanel(QWidget):
         with QSignalBlocker(self._spin_tube_current):
             self._spin_tube_current.setValue(src.tube_current_mA)
         with QSignalBlocker(self._combo_tube_method):
-            idx = self._combo_tube_method.findData(src.tube_output_method)
-            if idx >= 0:
+            idx = _TUBE_METHOD_INDEX.get(src.tube_output_method)
+            if idx is not None:
                 self._combo_tube_method.setCurrentIndex(idx)
         with QSignalBlocker(self._spin_pps):
             self._spin_pps.setValue(src.linac_pps)
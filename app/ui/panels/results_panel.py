@@ -13,13 +13,12 @@ from __future__ import annotations
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
 )
-from PyQt6.QtCore import Qt
 
 import numpy as np
 
 from app.core.i18n import t, TranslationManager
 from app.core.units import Gy_h_to_µSv_h
-from app.models.simulation import MetricStatus, QualityMetrics, SimulationResult
+from app.models.simulation import MetricStatus, SimulationResult
 
 
 # Status dot colors
@@ -29,6 +28,20 @@ _STATUS_COLORS: dict[MetricStatus, str] = {
     MetricStatus.POOR: "#EF4444",         # red
 }
 
+# Stylesheets built once rather than formatted per result update
+_STATUS_DOT_STYLES: dict[MetricStatus, str] = {
+    status: f"color: {color}; font-size: 8pt;"
+    for status, color in _STATUS_COLORS.items()
+}
+_DEFAULT_DOT_STYLE = "color: #64748B; font-size: 8pt;"
+
+# Overall label: one stylesheet, states picked by its "state" property
+_OVERALL_QSS = """
+QLabel[state="pass"] { color: #22C55E; font-weight: bold; font-size: 10pt; }
+QLabel[state="fail"] { color: #EF4444; font-weight: bold; font-size: 10pt; }
+QLabel[state="waiting"] { color: #94A3B8; font-size: 8pt; }
+"""
+
 
 class ResultsPanel(QWidget):
     """Score card showing beam simulation quality metrics.
@@ -53,6 +66,7 @@ class ResultsPanel(QWidget):
         self._overall_label = QLabel(t("results.waiting", "Waiting for simulation..."))
         self._overall_label.setProperty("cssClass", "prop-label")
         self._overall_label.setFixedWidth(300)
+        self._overall_label.setStyleSheet(_OVERALL_QSS)
         layout.addWidget(self._overall_label)
 
         # Metric rows container
@@ -81,6 +95,15 @@ class ResultsPanel(QWidget):
 
     def update_result(self, result: SimulationResult) -> None:
         """Update the score card with simulation results."""
+        # Rows are torn down and re-added in bulk; hold repaints of the
+        # metrics frame so it lays out and paints once at the end
+        self._metrics_frame.setUpdatesEnabled(False)
+        try:
+            self._fill_result(result)
+        finally:
+            self._metrics_frame.setUpdatesEnabled(True)
+
+    def _fill_result(self, result: SimulationResult) -> None:
         # Clear old metric rows
         while self._metrics_layout.count():
             item = self._metrics_layout.takeAt(0)
@@ -97,8 +120,9 @@ class ResultsPanel(QWidget):
 
             # Status dot
             dot = QLabel("\u2B24")  # filled circle
-            color = _STATUS_COLORS.get(metric.status, "#64748B")
-            dot.setStyleSheet(f"color: {color}; font-size: 8pt;")
+            dot.setStyleSheet(
+                _STATUS_DOT_STYLES.get(metric.status, _DEFAULT_DOT_STYLE)
+            )
             dot.setFixedWidth(14)
             row.addWidget(dot)
 
@@ -119,7 +143,7 @@ class ResultsPanel(QWidget):
             fwhm_row = QHBoxLayout()
             fwhm_row.setSpacing(6)
             fwhm_dot = QLabel("\u2022")
-            fwhm_dot.setStyleSheet("color: #64748B; font-size: 8pt;")
+            fwhm_dot.setStyleSheet(_DEFAULT_DOT_STYLE)
             fwhm_dot.setFixedWidth(14)
             fwhm_row.addWidget(fwhm_dot)
             fwhm_label = QLabel(f"FWHM: {qm.fwhm_mm:.1f} mm")
@@ -133,14 +157,10 @@ class ResultsPanel(QWidget):
         # Overall status
         if qm.all_pass:
             self._overall_label.setText(t("results.all_pass", "ALL PASS"))
-            self._overall_label.setStyleSheet(
-                "color: #22C55E; font-weight: bold; font-size: 10pt;"
-            )
+            self._set_overall_state("pass")
         else:
             self._overall_label.setText(t("results.some_fail", "SOME METRICS FAILED"))
-            self._overall_label.setStyleSheet(
-                "color: #EF4444; font-weight: bold; font-size: 10pt;"
-            )
+            self._set_overall_state("fail")
 
         # Summary
         bu_text = (
@@ -314,6 +334,16 @@ class ResultsPanel(QWidget):
         container.setLayout(row)
         self._metrics_layout.addWidget(container)
 
+    def _set_overall_state(self, state: str) -> None:
+        """Switch the overall label's style via its ``state`` property."""
+        lbl = self._overall_label
+        if lbl.property("state") == state:
+            return
+        lbl.setProperty("state", state)
+        style = lbl.style()
+        style.unpolish(lbl)
+        style.polish(lbl)
+
     def clear(self) -> None:
         """Reset the panel to waiting state."""
         while self._metrics_layout.count():
@@ -322,7 +352,5 @@ class ResultsPanel(QWidget):
                 item.widget().deleteLater()
         self._metric_rows.clear()
         self._overall_label.setText(t("results.waiting", "Waiting for simulation..."))
-        self._overall_label.setStyleSheet(
-            "color: #94A3B8; font-size: 8pt;"
-        )
+        self._set_overall_state("waiting")
         self._summary_label.setText("")
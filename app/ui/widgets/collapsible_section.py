@@ -7,9 +7,8 @@ Reference: Phase-03 spec — UI Panel Details.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QFrame, QSizePolicy,
+    QWidget, QVBoxLayout, QPushButton, QFrame,
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 
 
 class CollapsibleSection(QWidget):
@@ -0,0 +1,37 @@
+"""Material combo — QComboBox over one shared material item model.
+
+Every material combo lists the fixed ``MATERIAL_IDS`` (id as both text and
+data), so they all show the same QStandardItemModel instead of each filling
+its own item list. ``MATERIAL_INDEX`` maps a material id to its row.
+"""
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtWidgets import QApplication, QComboBox
+
+from app.constants import MATERIAL_IDS
+
+
+MATERIAL_INDEX: dict[str, int] = {mid: i for i, mid in enumerate(MATERIAL_IDS)}
+
+_model: QStandardItemModel | None = None
+
+
+def _material_model() -> QStandardItemModel:
+    """Shared model, built on first use and owned by the application."""
+    global _model
+    if _model is None or sip.isdeleted(_model):
+        _model = QStandardItemModel(QApplication.instance())
+        for mid in MATERIAL_IDS:
+            item = QStandardItem(mid)
+            item.setData(mid, Qt.ItemDataRole.UserRole)
+            _model.appendRow(item)
+    return _model
+
+
+def make_material_combo() -> QComboBox:
+    """Return a QComboBox listing all materials (row i = ``MATERIAL_IDS[i]``)."""
+    combo = QComboBox()
+    combo.setModel(_material_model())
+    return combo
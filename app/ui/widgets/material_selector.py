@@ -7,7 +7,6 @@ Reference: Phase-05 spec — MaterialSelector.
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QCheckBox
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QColor
 
 from app.core.material_database import MaterialService
 from app.ui.styles.colors import MATERIAL_COLORS
@@ -0,0 +1,67 @@
+"""Paged model — item model that loads its rows from a repository page by page.
+
+``KeysetPagedModel`` holds the rows fetched so far and asks for the next
+page through Qt's canFetchMore/fetchMore when the view scrolls to the
+end. Pages are keyset-based: the key of the last loaded row is passed to
+the fetch callback to get the rows after it. Subclasses supply ``data``
+(and ``columnCount`` for more than one column) and ``_page_key``.
+"""
+
+from typing import Any, Callable
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex
+
+
+class KeysetPagedModel(QAbstractTableModel):
+    """Read-only model over rows fetched lazily, one page at a time.
+
+    *fetch_page(before_key)* must return the rows following the row with
+    *before_key* (the first page for None), at most *page_size* of them.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Any], list],
+        page_size: int,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._rows: list = []
+        self._has_more = False
+
+    def _page_key(self, row) -> Any:
+        """Key of *row*, passed to ``fetch_page`` to get the rows after it."""
+        raise NotImplementedError
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def reload(self) -> None:
+        """Drop all rows and fetch the first page."""
+        page = self._fetch_page(None)
+        self.beginResetModel()
+        self._rows = list(page)
+        self._has_more = len(page) >= self._page_size
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        # Every loaded row may have been removed; then start from the top
+        before = self._page_key(self._rows[-1]) if self._rows else None
+        page = self._fetch_page(before)
+        self._has_more = len(page) >= self._page_size
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
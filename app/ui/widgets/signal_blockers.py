@@ -0,0 +1,28 @@
+"""Signal blockers — block signals of several widgets at once.
+
+``MultiBlocker`` is the many-widget counterpart of ``QSignalBlocker``:
+panels that write a group of editors from the model use one ``with``
+block instead of nesting a QSignalBlocker per editor.
+"""
+
+from PyQt6.QtWidgets import QWidget
+
+
+class MultiBlocker:
+    """Block signals of several widgets for the duration of a ``with``.
+
+    Restores each widget's previous blocked state on exit.
+    """
+
+    __slots__ = ("_widgets", "_prev")
+
+    def __init__(self, widgets: tuple[QWidget, ...]):
+        self._widgets = widgets
+        self._prev: list[bool] = []
+
+    def __enter__(self) -> None:
+        self._prev = [w.blockSignals(True) for w in self._widgets]
+
+    def __exit__(self, *exc) -> None:
+        for w, prev in zip(self._widgets, self._prev):
+            w.blockSignals(prev)
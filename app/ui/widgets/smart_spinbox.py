@@ -7,7 +7,7 @@ arrow buttons (and keyboard arrows) always work correctly.
 """
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QKeyEvent, QValidator
+from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import QDoubleSpinBox
 
 
@@ -1,51 +1,209 @@
 """Validation worker — background thread for physics validation tests.
 
-Runs ValidationRunner off the UI thread to prevent blocking.
+Runs ValidationRunner off the UI thread to prevent blocking. The results
+table text is also formatted here, so the UI thread only displays it.
+The validation PDF report is generated off the UI thread as well.
 """
 
 from __future__ import annotations
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import functools
+import threading
+from typing import TYPE_CHECKING
 
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 
-class ValidationWorker(QThread):
-    """Background thread for validation test execution.
+if TYPE_CHECKING:
+    from app.core.validation_runner import ValidationResult, ValidationSummary
+
+# (test_id, group, ours, reference, diff%, tolerance%, status key)
+RenderedRow = tuple[str, str, str, str, str, str, str]
+
+
+def _fmt(val: float) -> str:
+    if not val:
+        return "0"
+    mag = abs(val)
+    if mag < 0.001 or mag > 1e4:
+        return f"{val:.4e}"
+    return f"{val:.4f}"
+
+
+def _status_key(r: ValidationResult) -> str:
+    if r.skipped:
+        return "skip"
+    return "pass" if r.passed else "fail"
+
+
+def render_results(summary: ValidationSummary) -> list[RenderedRow]:
+    """Format every result as display strings for the results table.
+
+    The status key is one of ``"pass"``, ``"fail"``, ``"skip"``.
+    """
+    fmt, status_key = _fmt, _status_key
+    return [
+        (
+            r.test_id,
+            r.group,
+            fmt(r.our_value),
+            fmt(r.ref_value),
+            f"{r.diff_pct:.2f}" if not r.skipped else "-",
+            f"{r.tolerance_pct:.1f}" if r.tolerance_pct > 0 else "exact",
+            status_key(r),
+        )
+        for r in summary.results
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_exporter_cls():
+    """Import ValidationReportExporter (reportlab) on first use only."""
+    from app.export.validation_report import ValidationReportExporter
+    return ValidationReportExporter
+
+
+class _PoolWorker(QObject):
+    """Base for workers whose ``run()`` is executed on the global QThreadPool.
+
+    Tracks whether a queued or running task is outstanding, so an owner
+    can wait for this worker alone instead of the whole pool.
+
+    The worker is parented to the application, so the pool thread
+    dropping its reference never deletes it there; the owner keeps it
+    until ``finished`` has been handled and then calls ``deleteLater()``.
+    ``finished`` carries the *token* given at construction, which lets
+    the owner tell the current run from stale ones.
+    """
+
+    finished = pyqtSignal(int)
+
+    def __init__(self, token: int = 0):
+        super().__init__(QCoreApplication.instance())
+        self.token = token
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def start(self) -> None:
+        """Queue ``run()`` on the global thread pool."""
+        self._idle.clear()
+        QThreadPool.globalInstance().start(_WorkerRunnable(self))
+
+    def wait(self, timeout_ms: int) -> bool:
+        """Block up to *timeout_ms* until ``run()`` has returned.
+
+        Returns:
+            True if the worker is idle (finished or never started).
+        """
+        return self._idle.wait(timeout_ms / 1000)
+
+    def mark_done(self) -> None:
+        """Record that ``run()`` has returned (called by the pool task)."""
+        self._idle.set()
+
+    def run(self) -> None:
+        raise NotImplementedError
+
+
+class ValidationWorker(_PoolWorker):
+    """Validation test execution on a QThreadPool thread.
+
+    The worker is a plain QObject carrying the signals; ``start()`` hands a
+    ``_WorkerRunnable`` to the global thread pool, so repeated runs
+    reuse pooled threads instead of creating and tearing down a QThread.
 
     Signals:
         progress(int, str): 0-100% and current test id.
-        result_ready(object): ValidationSummary on success.
+        result_ready(object, list): ValidationSummary and its
+            ``render_results`` rows on success.
         error_occurred(str): Error message on failure.
+        finished(int): Emitted last, after success, failure or
+            cancellation, with the worker's token.
     """
 
     progress = pyqtSignal(int, str)
-    result_ready = pyqtSignal(object)
+    result_ready = pyqtSignal(object, list)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._cancelled = False
+    def __init__(self, token: int = 0):
+        super().__init__(token)
+        self._cancelled = threading.Event()
 
     def cancel(self) -> None:
         """Request cancellation."""
-        self._cancelled = True
+        self._cancelled.set()
 
     def run(self) -> None:
-        """Execute validation checks in background thread."""
+        """Execute validation checks (called on a pool thread)."""
         try:
             from app.core.validation_runner import ValidationRunner
 
             runner = ValidationRunner(
                 progress_callback=self._on_progress,
-                cancelled_check=lambda: self._cancelled,
+                cancelled_check=self._cancelled.is_set,
             )
             summary = runner.run_all()
 
-            if not self._cancelled:
-                self.result_ready.emit(summary)
+            if not self._cancelled.is_set():
+                self.result_ready.emit(summary, render_results(summary))
 
         except Exception as e:
             self.error_occurred.emit(str(e))
+        finally:
+            self.finished.emit(self.token)
 
     def _on_progress(self, pct: int, test_id: str) -> None:
-        if not self._cancelled:
+        if not self._cancelled.is_set():
             self.progress.emit(pct, test_id)
+
+
+class ValidationReportWorker(_PoolWorker):
+    """Validation PDF report generation on a QThreadPool thread.
+
+    Signals:
+        result_ready(str): Output file path on success.
+        error_occurred(str): Error message on failure.
+        finished(int): Emitted last, after success or failure, with the
+            worker's token.
+    """
+
+    result_ready = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(
+        self, summary: ValidationSummary, output_path: str, token: int = 0,
+    ):
+        super().__init__(token)
+        self._summary = summary
+        self._output_path = output_path
+
+    def run(self) -> None:
+        """Generate the PDF (called on a pool thread)."""
+        try:
+            exporter = _get_exporter_cls()()
+            exporter.generate_report(self._summary, self._output_path)
+            self.result_ready.emit(self._output_path)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            self.finished.emit(self.token)
+
+
+class _WorkerRunnable(QRunnable):
+    """Pool task that runs a worker's ``run()`` (and keeps it alive)."""
+
+    def __init__(self, worker: _PoolWorker):
+        super().__init__()
+        self._worker = worker
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        try:
+            self._worker.run()
+        finally:
+            self._worker.mark_done()
@@ -245,6 +245,21 @@ class TestVersionHistory:
         assert len(versions) == 3
         assert "geri yuklendi" in versions[0].change_note
 
+    def test_version_history_pages(self, repo):
+        geo = _make_geometry()
+        design_id = repo.save_design(geo, "Paged")
+        for i in range(4):
+            repo.update_design(design_id, geo, f"Update {i + 1}")
+
+        first = repo.get_version_history(design_id, limit=2)
+        assert [v.version_number for v in first] == [5, 4]
+        second = repo.get_version_history(
+            design_id, limit=2, before_version=first[-1].version_number,
+        )
+        assert [v.version_number for v in second] == [3, 2]
+        rest = repo.get_version_history(design_id, before_version=2)
+        assert [v.version_number for v in rest] == [1]
+
 
 # ── Simulation Results ───────────────────────────────────────────────
 
@@ -320,6 +335,41 @@ class TestSettings:
         assert repo.get_setting("key") == "value2"
 
 
+# ── Notes ────────────────────────────────────────────────────────────
+
+class TestNotes:
+
+    def test_add_note_returns_row(self, repo):
+        note = repo.add_note("design", "d1", "First note")
+        assert note["content"] == "First note"
+        assert note["created_at"]
+
+        notes = repo.get_notes("design", "d1")
+        assert notes == [note]
+
+    def test_delete_note(self, repo):
+        note = repo.add_note("design", "d1", "To delete")
+        repo.add_note("design", "d1", "To keep")
+        repo.delete_note(note["id"])
+
+        notes = repo.get_notes("design", "d1")
+        assert [n["content"] for n in notes] == ["To keep"]
+
+    def test_get_notes_pages(self, repo):
+        for i in range(5):
+            repo.add_note("design", "d1", f"Note {i}")
+        repo.add_note("design", "other", "Elsewhere")
+
+        first = repo.get_notes("design", "d1", limit=2)
+        assert [n["content"] for n in first] == ["Note 4", "Note 3"]
+
+        second = repo.get_notes("design", "d1", limit=2, before_id=first[-1]["id"])
+        assert [n["content"] for n in second] == ["Note 2", "Note 1"]
+
+        rest = repo.get_notes("design", "d1", before_id=second[-1]["id"])
+        assert [n["content"] for n in rest] == ["Note 0"]
+
+
 # ── Recent Designs ───────────────────────────────────────────────────
 
 class TestRecentDesigns:
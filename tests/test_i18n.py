@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from app.core.i18n import TranslationManager, _flatten, t
+from app.core.i18n import TranslationManager, _flatten, t, t_many
 
 TRANSLATIONS_DIR = Path(__file__).parent.parent / "translations"
 
@@ -120,6 +120,12 @@ class TestTranslationManager:
         mgr.set_language("de")
         assert callback_count[0] == 1  # not called again
 
+    def test_lang_gen_bumps_on_language_change(self):
+        mgr = TranslationManager.init("tr")
+        gen = TranslationManager.lang_gen
+        mgr.set_language("en")
+        assert TranslationManager.lang_gen == gen + 1
+
 
 class TestGlobalTFunction:
     def test_t_function(self):
@@ -135,6 +141,12 @@ class TestGlobalTFunction:
         result = t("status.zoom", "Zoom: {pct}").format(pct="150%")
         assert "150%" in result
 
+    def test_t_many(self):
+        TranslationManager.init("tr")
+        assert t_many([("toolbar.file", "File"), ("nonexistent", "fallback")]) == [
+            t("toolbar.file", "File"), "fallback",
+        ]
+
 
 class TestTranslationFileConsistency:
     """Ensure all translation files have the same keys."""